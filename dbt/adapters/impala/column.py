@@ -13,13 +13,16 @@
 # limitations under the License.
 
 from dataclasses import dataclass
-from typing import TypeVar, Optional, Dict, Any
+from typing import TypeVar, Optional, Dict, Any, Iterable, List, Sequence
 
 from dbt.adapters.base.column import Column
 from dbt_common.dataclass_schema import dbtClassMixin
 
 Self = TypeVar("Self", bound="ImpalaColumn")
 
+# labels of the show column stats columns after Column and Type
+COLUMN_STATS = ("distinct values", "nulls", "max size", "avg size")
+
 
 @dataclass
 class ImpalaColumn(dbtClassMixin, Column):
@@ -77,6 +80,33 @@ class ImpalaColumn(dbtClassMixin, Column):
                 table_stats[f"stats:{key}:include"] = True
         return table_stats
 
+    @staticmethod
+    def convert_column_stats(rows: Iterable[Sequence[Any]]) -> Dict[str, Any]:
+        """Summarize show column stats rows into a single catalog stat, skipping unknown (-1)
+        values.
+
+        The stat counts the columns with known stats and describes them, so the catalog gets the
+        same four fields however wide the table is.
+        """
+        summaries = []
+        for row in rows:
+            known = [
+                f"{value} {label}"
+                for label, value in zip(COLUMN_STATS, row[2:])
+                if value is not None and value != -1
+            ]
+            if known:
+                summaries.append(f"{row[0]}: {', '.join(known)}")
+
+        if not summaries:
+            return {}
+        return {
+            "stats:column_stats:label": "columns with stats",
+            "stats:column_stats:value": len(summaries),
+            "stats:column_stats:description": "; ".join(summaries),
+            "stats:column_stats:include": True,
+        }
+
     def to_column_dict(self, omit_none: bool = True, validate: bool = False):
         original_dict = self.to_dict(omit_none=omit_none)
 
@@ -85,3 +115,90 @@ class ImpalaColumn(dbtClassMixin, Column):
         if original_stats:
             original_dict.update(original_stats)
         return original_dict
+
+
+class ImpalaTableMetadata:
+    """Table level fields of a catalog relation, shared by all of its columns."""
+
+    __slots__ = (
+        "table_schema",
+        "table_name",
+        "table_type",
+        "table_owner",
+        "table_stats",
+        "table_comment",
+    )
+
+    def __init__(
+        self,
+        table_schema: Optional[str],
+        table_name: Optional[str],
+        table_type: Optional[str],
+        table_owner: Optional[str],
+        table_stats: Optional[Dict[str, Any]],
+        table_comment: Optional[str],
+    ):
+        self.table_schema = table_schema
+        self.table_name = table_name
+        self.table_type = table_type
+        self.table_owner = table_owner
+        self.table_stats = table_stats
+        self.table_comment = table_comment
+
+
+class ImpalaCatalogColumn:
+    """Compact column of the catalog, expanded into a catalog row only by to_column_dict."""
+
+    __slots__ = ("table", "column", "dtype", "column_index", "comment")
+
+    def __init__(
+        self,
+        table: ImpalaTableMetadata,
+        column: str,
+        dtype: str,
+        column_index: Optional[int],
+        comment: Optional[str],
+    ):
+        self.table = table
+        self.column = column
+        self.dtype = dtype
+        self.column_index = column_index
+        self.comment = comment
+
+    @classmethod
+    def from_columns(cls, columns: List[ImpalaColumn]) -> List["ImpalaCatalogColumn"]:
+        """Convert the columns of one relation, taking the table level fields from the first."""
+        if not columns:
+            return []
+
+        first = columns[0]
+        table = ImpalaTableMetadata(
+            table_schema=first.table_schema,
+            table_name=first.table_name,
+            table_type=first.table_type,
+            table_owner=first.table_owner,
+            table_stats=first.table_stats,
+            table_comment=first.table_comment,
+        )
+        return [
+            cls(table, column.column, column.dtype, column.column_index, column.comment)
+            for column in columns
+        ]
+
+    def to_column_dict(self) -> Dict[str, Any]:
+        table = self.table
+        column_dict = {
+            "table_database": None,
+            "table_schema": table.table_schema,
+            "table_name": table.table_name,
+            "table_type": table.table_type,
+            "table_owner": table.table_owner,
+            "column_index": self.column_index,
+            "column_name": self.column,
+            "column_type": self.dtype,
+            "column_comment": self.comment,
+            "table_comment": table.table_comment,
+        }
+        if table.table_stats:
+            column_dict.update(table.table_stats)
+        return column_dict
@@ -0,0 +1,140 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, List, TypeVar
+
+from dbt.adapters.events.logging import AdapterLogger
+
+logger = AdapterLogger("Impala")
+
+T = TypeVar("T")
+
+
+class PooledConnection:
+    """An impyla connection handle tracked by an ImpalaConnectionPool."""
+
+    __slots__ = ("handle", "created_at", "last_used_at")
+
+    def __init__(self, handle: Any):
+        self.handle = handle
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+
+    def age(self, now: float) -> float:
+        return now - self.created_at
+
+    def idle_time(self, now: float) -> float:
+        return now - self.last_used_at
+
+
+class ImpalaConnectionPool:
+    """A bounded pool of idle impyla connection handles for one set of credentials.
+
+    Handles are checked out by ImpalaConnectionManager.open and returned by
+    ImpalaConnectionManager.close, so the TLS handshake, SASL/Kerberos auth and
+    transport setup are paid once per handle instead of once per dbt connection.
+    Handles idle for longer than ``idle_timeout`` or older than ``max_lifetime``
+    seconds are closed instead of being reused.
+    """
+
+    def __init__(self, max_size: int, idle_timeout: float, max_lifetime: float):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self._idle: Deque[PooledConnection] = deque()
+        self._lock = threading.Lock()
+
+    def _is_expired(self, pooled: PooledConnection, now: float) -> bool:
+        if self.max_lifetime and pooled.age(now) > self.max_lifetime:
+            return True
+        if self.idle_timeout and pooled.idle_time(now) > self.idle_timeout:
+            return True
+        return False
+
+    def _evict_expired(self, now: float) -> List[PooledConnection]:
+        # must be called while holding the lock
+        expired = [pooled for pooled in self._idle if self._is_expired(pooled, now)]
+        for pooled in expired:
+            self._idle.remove(pooled)
+        return expired
+
+    def checkout(self, connect: Callable[[], Any], wrap: Callable[[PooledConnection], T]) -> T:
+        """Return ``wrap(pooled)`` for a healthy pooled handle, or for a new one from ``connect``.
+
+        ``wrap`` doubles as the health check: a pooled handle for which it raises is
+        discarded and the next one is tried.
+        """
+        while True:
+            with self._lock:
+                expired = self._evict_expired(time.monotonic())
+                pooled = self._idle.pop() if self._idle else None
+
+            for stale in expired:
+                logger.debug("Closing expired pooled connection")
+                self._close(stale)
+
+            if pooled is None:
+                break
+
+            try:
+                wrapped = wrap(pooled)
+            except Exception as ex:
+                logger.debug(f"Discarding unhealthy pooled connection: {ex}")
+                self._close(pooled)
+                continue
+
+            pooled.last_used_at = time.monotonic()
+            logger.debug("Reusing pooled connection")
+            return wrapped
+
+        return wrap(PooledConnection(connect()))
+
+    def release(self, pooled: PooledConnection, reusable: bool = True) -> None:
+        """Return a checked out handle to the pool, closing it if it cannot be kept."""
+        now = time.monotonic()
+        pooled.last_used_at = now
+
+        keep = reusable and not (self.max_lifetime and pooled.age(now) > self.max_lifetime)
+        with self._lock:
+            expired = self._evict_expired(now)
+            if keep and len(self._idle) < self.max_size:
+                self._idle.append(pooled)
+                pooled = None
+
+        for stale in expired:
+            self._close(stale)
+        if pooled is not None:
+            self._close(pooled)
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+
+        for pooled in idle:
+            self._close(pooled)
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    @staticmethod
+    def _close(pooled: PooledConnection) -> None:
+        try:
+            pooled.handle.close()
+        except Exception as exc:
+            logger.debug(f"Exception while closing pooled connection: {exc}")
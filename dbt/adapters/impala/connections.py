@@ -13,18 +13,24 @@
 # limitations under the License.
 
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+import atexit
+import os
+import re
+import threading
 import time
 import dbt.exceptions
 
+from concurrent.futures import ThreadPoolExecutor
+
 from dbt_common.exceptions import DbtDatabaseError
 
 from dbt.adapters.contracts.connection import Credentials
 from dbt.adapters.sql import SQLConnectionManager
 from dbt.adapters.contracts.connection import AdapterRequiredConfig
 
-from typing import Optional, Tuple, Any
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any, TYPE_CHECKING
 from multiprocessing.context import SpawnContext
 
 from dbt.adapters.contracts.connection import Connection, AdapterResponse, ConnectionState
@@ -42,10 +48,26 @@ from impala.error import HiveServer2Error
 import json
 
 from dbt.adapters.impala.__version__ import version as ADAPTER_VERSION
+from dbt.adapters.impala.connection_pool import ImpalaConnectionPool, PooledConnection
+from dbt.adapters.impala.query_profile import QueryProfileSummary, parse_query_profile
+from dbt.adapters.impala.sql_splitter import split_statements
+
+if TYPE_CHECKING:
+    import agate
 
 DEFAULT_IMPALA_HOST = "localhost"
 DEFAULT_IMPALA_PORT = 21050
 DEFAULT_MAX_RETRIES = 3
+DEFAULT_CONNECTION_POOL_SIZE = 8
+DEFAULT_CONNECTION_POOL_IDLE_TIMEOUT = 300  # seconds
+DEFAULT_CONNECTION_POOL_MAX_LIFETIME = 3600  # seconds
+DEFAULT_FETCH_BATCH_SIZE = 1024
+DEFAULT_ASYNC_POLL_INTERVAL = 0.01  # seconds, the first poll interval of impyla
+DEFAULT_ASYNC_MAX_POLL_INTERVAL = 1.0  # seconds, the longest poll interval of impyla
+DEFAULT_METADATA_CACHE_TTL = 600  # seconds
+ASYNC_PROGRESS_INTERVAL = 30.0  # seconds between progress events of a running query
+
+IMPALA_VERSION_REGEX = re.compile(r"(\d+)\.(\d+)(?:\.(\d+))?")
 
 logger = AdapterLogger("Impala")
 
@@ -64,6 +86,25 @@ class ImpalaCredentials(Credentials):
     use_ssl: Optional[bool] = True
     http_path: Optional[str] = ""  # for supporting a knox proxy in ldap env
     retries: Optional[int] = DEFAULT_MAX_RETRIES
+    use_connection_pool: Optional[bool] = False
+    connection_pool_size: Optional[int] = DEFAULT_CONNECTION_POOL_SIZE
+    connection_pool_idle_timeout: Optional[int] = DEFAULT_CONNECTION_POOL_IDLE_TIMEOUT
+    connection_pool_max_lifetime: Optional[int] = DEFAULT_CONNECTION_POOL_MAX_LIFETIME
+    prewarm_connections: Optional[bool] = False
+    fetch_batch_size: Optional[int] = DEFAULT_FETCH_BATCH_SIZE
+    execute_async: Optional[bool] = False
+    async_poll_interval: Optional[float] = DEFAULT_ASYNC_POLL_INTERVAL
+    async_max_poll_interval: Optional[float] = DEFAULT_ASYNC_MAX_POLL_INTERVAL
+    capture_query_profile: Optional[bool] = False
+    query_profile_dir: Optional[str] = None
+    cache_population_threads: Optional[int] = None
+    bulk_column_metadata: Optional[bool] = False
+    metadata_cache: Optional[bool] = False
+    metadata_cache_ttl: Optional[int] = DEFAULT_METADATA_CACHE_TTL
+    catalog_threads: Optional[int] = None
+    catalog_column_stats: Optional[bool] = False
+    seed_staging_dir: Optional[str] = None
+    seed_staging_location: Optional[str] = None
 
     _ALIASES = {"dbname": "database", "pass": "password", "user": "username"}
 
@@ -99,24 +140,82 @@ class ImpalaCredentials(Credentials):
         # adapter anonymous adoption
         return self.host
 
+    def _pool_key(self) -> Tuple:
+        # handles can only be shared between connections that would have been opened identically
+        return (
+            self.host,
+            self.port,
+            (self.auth_type or "").lower(),
+            self.username,
+            self.password,
+            self.kerberos_service_name,
+            self.use_http_transport,
+            self.use_ssl,
+            self.http_path,
+            self.retries,
+        )
+
+
+@dataclass
+class ImpalaAdapterResponse(AdapterResponse):
+    peak_memory_bytes: Optional[int] = None
+    bytes_scanned: Optional[int] = None
+    rows_produced: Optional[int] = None
+    admission_wait_ms: Optional[float] = None
+    fragment_times_ms: Dict[str, float] = field(default_factory=dict)
+    profile_path: Optional[str] = None
+    partitions_rewritten: Optional[int] = None
+
 
 class ImpalaConnectionWrapper:
-    def __init__(self, handle):
+    def __init__(
+        self,
+        handle,
+        pooled: Optional[PooledConnection] = None,
+        fetch_batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+    ):
         self.handle = handle
-        self._cursor = self.handle.cursor()
+        # set when the handle was checked out of a connection pool and should be returned to it
+        self.pooled = pooled
+        self.reusable = True
+        self.fetch_batch_size = fetch_batch_size
+        # summary of the runtime profiles of the statements of the last add_query
+        self.query_profile: Optional[QueryProfileSummary] = None
+        self._cursor = self._new_cursor()
+        # coordination between a thread polling an async query and a cancel from another thread
+        self._async_running = False
+        self._cancel_requested = threading.Event()
+        self._cancel_done = threading.Event()
+
+    def _new_cursor(self):
+        cursor = self.handle.cursor()
+        # impyla fetches arraysize rows per round trip, 10240 when it is not set
+        cursor.arraysize = self.fetch_batch_size
+        return cursor
 
     def cursor(self):
         if not self._cursor:
-            self._cursor = self.handle.cursor()
+            self._cursor = self._new_cursor()
         return self
 
     def cancel(self):
         if self._cursor:
             try:
-                self._cursor.cancel()
+                self._cursor.cancel_operation()
             except OSError as exc:
                 logger.debug(f"Exception while cancelling query: {exc}")
 
+    def request_cancel(self, timeout: float) -> bool:
+        """Ask the thread polling an async query to cancel it on the server.
+
+        Returns True if the query was cancelled within timeout seconds, False if no async
+        query is running or the polling thread did not get to it in time.
+        """
+        if not self._async_running:
+            return False
+        self._cancel_requested.set()
+        return self._cancel_done.wait(timeout)
+
     def close(self):
         if self._cursor:
             try:
@@ -134,10 +233,78 @@ class ImpalaConnectionWrapper:
     def fetchone(self):
         return self._cursor.fetchone()
 
+    def fetchmany(self, size=None):
+        return self._cursor.fetchmany(size or self.fetch_batch_size)
+
+    def iter_rows(self, batch_size: Optional[int] = None, limit: Optional[int] = None):
+        """Yield result rows as they are fetched, holding at most one batch in memory.
+
+        A limit of None or 0 yields every row, like the limit of get_result_from_cursor.
+        """
+        batch_size = batch_size or self.fetch_batch_size
+        remaining = limit or None
+        while remaining is None or remaining > 0:
+            size = batch_size if remaining is None else min(batch_size, remaining)
+            rows = self._cursor.fetchmany(size)
+            if not rows:
+                break
+            yield from rows
+            if remaining is not None:
+                remaining -= len(rows)
+
     def execute(self, sql, bindings=None, configuration={}):
         result = self._cursor.execute(sql, bindings, configuration)
         return result
 
+    def execute_async(
+        self,
+        sql,
+        bindings=None,
+        configuration={},
+        poll_interval: float = DEFAULT_ASYNC_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_ASYNC_MAX_POLL_INTERVAL,
+        on_progress: Optional[Callable[[float], None]] = None,
+    ):
+        """Submit sql and poll until it finishes, backing off exponentially between polls.
+
+        on_progress is called with the elapsed seconds every ASYNC_PROGRESS_INTERVAL
+        seconds. A request_cancel from another thread cancels the query on the server.
+        """
+        self._cancel_requested.clear()
+        self._cancel_done.clear()
+        self._cursor.execute_async(sql, bindings, configuration)
+        self._async_running = True
+        try:
+            start_time = last_progress_time = time.time()
+            while self._cursor.is_executing():
+                if self._cancel_requested.wait(poll_interval):
+                    self._cursor.cancel_operation()
+                    self._cancel_done.set()
+                    raise dbt.exceptions.DbtRuntimeError("Query was cancelled")
+                poll_interval = min(poll_interval * 2, max_poll_interval)
+
+                now = time.time()
+                if on_progress and now - last_progress_time >= ASYNC_PROGRESS_INTERVAL:
+                    last_progress_time = now
+                    on_progress(now - start_time)
+        except KeyboardInterrupt:
+            self._cursor.cancel_operation()
+            raise
+        finally:
+            self._async_running = False
+
+        # same completion handling as HiveServer2Cursor.execute: surface errors and close
+        # queries that don't return rows so their DML row counts are available
+        self._cursor._wait_to_finish()
+        if not self._cursor.has_result_set and self._cursor.close_finished_queries:
+            self._cursor._close_finished_operation()
+
+    def get_summary(self):
+        return self._cursor.get_summary()
+
+    def get_profile(self):
+        return self._cursor.get_profile()
+
     @property
     def description(self):
         return self._cursor.description
@@ -148,6 +315,11 @@ class ImpalaConnectionManager(SQLConnectionManager):
 
     impala_version = None
 
+    _connection_pools: Dict[Tuple, ImpalaConnectionPool] = {}
+    _connection_pools_lock = threading.Lock()
+    # number of connections to pre-warm by pool key, consumed by the first open of the pool
+    _prewarm_requests: Dict[Tuple, int] = {}
+
     def __init__(self, profile: AdapterRequiredConfig, mp_context: SpawnContext):
         super().__init__(profile, mp_context)
 
@@ -156,11 +328,13 @@ class ImpalaConnectionManager(SQLConnectionManager):
         try:
             yield
         except HttpError as httpError:
+            self._discard_thread_handle()
             logger.debug(f"Authorization error: {httpError}")
             raise dbt.exceptions.DbtRuntimeError(
                 "HTTP Authorization error: " + str(httpError) + ", please check your credentials"
             )
         except HiveServer2Error as servError:
+            self._discard_thread_handle()
             logger.debug(f"Server connection error: {servError}")
             raise dbt.exceptions.DbtRuntimeError(
                 "Unable to establish connection to Impala server: " + str(servError)
@@ -183,60 +357,28 @@ class ImpalaConnectionManager(SQLConnectionManager):
 
         try:
             connection_start_time = time.time()
-            # the underlying dbapi supports retries, so this is directly used instead to support retries
-            if (
-                credentials.auth_type == "LDAP" or credentials.auth_type == "ldap"
-            ):  # ldap connection
-                custom_user_agent = "dbt/cloudera-impala-v" + ADAPTER_VERSION
-                logger.debug(f"Using user agent: {custom_user_agent}")
-                handle = impala.dbapi.connect(
-                    host=credentials.host,
-                    port=credentials.port,
-                    auth_mechanism="LDAP",
-                    use_http_transport=credentials.use_http_transport,
-                    user=credentials.username,
-                    password=credentials.password,
-                    use_ssl=credentials.use_ssl,
-                    http_path=credentials.http_path,
-                    retries=credentials.retries,
-                    user_agent=custom_user_agent,
-                )
-            elif (
-                credentials.auth_type == "GSSAPI"
-                or credentials.auth_type == "gssapi"
-                or credentials.auth_type == "kerberos"
-            ):  # kerberos based connection
-                handle = impala.dbapi.connect(
-                    host=credentials.host,
-                    port=credentials.port,
-                    auth_mechanism="GSSAPI",
-                    kerberos_service_name=credentials.kerberos_service_name,
-                    use_http_transport=credentials.use_http_transport,
-                    use_ssl=credentials.use_ssl,
-                    retries=credentials.retries,
+            if credentials.use_connection_pool:
+                with cls._connection_pools_lock:
+                    prewarm_count = cls._prewarm_requests.pop(credentials._pool_key(), 0)
+                if prewarm_count:
+                    cls.prewarm_connections(credentials, prewarm_count)
+
+                pool = cls._get_connection_pool(credentials)
+                connection.handle = pool.checkout(
+                    lambda: cls._connect(credentials),
+                    lambda pooled: ImpalaConnectionWrapper(
+                        pooled.handle,
+                        pooled=pooled,
+                        fetch_batch_size=credentials.fetch_batch_size,
+                    ),
                 )
-            elif (
-                credentials.auth_type == "PLAIN" or credentials.auth_type == "plain"
-            ):  # plain type connection
-                handle = impala.dbapi.connect(
-                    host=credentials.host,
-                    port=credentials.port,
-                    auth_mechanism="PLAIN",
-                    use_ssl=credentials.use_ssl,
-                    user=credentials.username,
-                    password=credentials.password,
-                    retries=credentials.retries,
-                )
-            else:  # default, insecure connection
-                handle = impala.dbapi.connect(
-                    host=credentials.host,
-                    port=credentials.port,
-                    retries=credentials.retries,
+            else:
+                connection.handle = ImpalaConnectionWrapper(
+                    cls._connect(credentials), fetch_batch_size=credentials.fetch_batch_size
                 )
             connection_end_time = time.time()
 
             connection.state = ConnectionState.OPEN
-            connection.handle = ImpalaConnectionWrapper(handle)
 
             ImpalaConnectionManager.fetch_impala_version(connection.handle)
         except Exception as ex:
@@ -255,6 +397,157 @@ class ImpalaConnectionManager(SQLConnectionManager):
 
         return connection
 
+    @classmethod
+    def _connect(cls, credentials):
+        # the underlying dbapi supports retries, so this is directly used instead to support retries
+        if credentials.auth_type == "LDAP" or credentials.auth_type == "ldap":  # ldap connection
+            custom_user_agent = "dbt/cloudera-impala-v" + ADAPTER_VERSION
+            logger.debug(f"Using user agent: {custom_user_agent}")
+            handle = impala.dbapi.connect(
+                host=credentials.host,
+                port=credentials.port,
+                auth_mechanism="LDAP",
+                use_http_transport=credentials.use_http_transport,
+                user=credentials.username,
+                password=credentials.password,
+                use_ssl=credentials.use_ssl,
+                http_path=credentials.http_path,
+                retries=credentials.retries,
+                user_agent=custom_user_agent,
+            )
+        elif (
+            credentials.auth_type == "GSSAPI"
+            or credentials.auth_type == "gssapi"
+            or credentials.auth_type == "kerberos"
+        ):  # kerberos based connection
+            handle = impala.dbapi.connect(
+                host=credentials.host,
+                port=credentials.port,
+                auth_mechanism="GSSAPI",
+                kerberos_service_name=credentials.kerberos_service_name,
+                use_http_transport=credentials.use_http_transport,
+                use_ssl=credentials.use_ssl,
+                retries=credentials.retries,
+            )
+        elif (
+            credentials.auth_type == "PLAIN" or credentials.auth_type == "plain"
+        ):  # plain type connection
+            handle = impala.dbapi.connect(
+                host=credentials.host,
+                port=credentials.port,
+                auth_mechanism="PLAIN",
+                use_ssl=credentials.use_ssl,
+                user=credentials.username,
+                password=credentials.password,
+                retries=credentials.retries,
+            )
+        else:  # default, insecure connection
+            handle = impala.dbapi.connect(
+                host=credentials.host,
+                port=credentials.port,
+                retries=credentials.retries,
+            )
+
+        return handle
+
+    @classmethod
+    def _get_connection_pool(cls, credentials) -> ImpalaConnectionPool:
+        key = credentials._pool_key()
+        with cls._connection_pools_lock:
+            pool = cls._connection_pools.get(key)
+            if pool is None:
+                pool = ImpalaConnectionPool(
+                    max_size=credentials.connection_pool_size,
+                    idle_timeout=credentials.connection_pool_idle_timeout,
+                    max_lifetime=credentials.connection_pool_max_lifetime,
+                )
+                cls._connection_pools[key] = pool
+            return pool
+
+    @classmethod
+    def close_connection_pools(cls):
+        with cls._connection_pools_lock:
+            pools = list(cls._connection_pools.values())
+            cls._connection_pools.clear()
+
+        for pool in pools:
+            pool.close_all()
+
+    @classmethod
+    def _close_handle(cls, connection):
+        super()._close_handle(connection)
+
+        wrapper = connection.handle
+        pooled = getattr(wrapper, "pooled", None)
+        if pooled is not None:
+            # hand the underlying handle back exactly once, even if close is called again
+            wrapper.pooled = None
+            cls._get_connection_pool(connection.credentials).release(
+                pooled, reusable=wrapper.reusable
+            )
+
+    def request_prewarm(self, count: int) -> None:
+        """Pre-warm up to ``count`` pooled connections when the first connection is opened.
+
+        Commands that never run a query, like parse or ls, never open a connection and so
+        never pre-warm any.
+        """
+        credentials = self.profile.credentials
+        if not credentials.use_connection_pool:
+            logger.debug("prewarm_connections requires use_connection_pool, skipping pre-warming")
+            return
+
+        with self._connection_pools_lock:
+            self._prewarm_requests[credentials._pool_key()] = count
+
+    @classmethod
+    def prewarm_connections(cls, credentials, count: int) -> List[float]:
+        """Open up to ``count`` connections concurrently and park them in the connection pool.
+
+        ``count`` is capped by ``connection_pool_size``, connections already idle in the pool
+        count towards it. Returns the elapsed time of every connection opened, a connection
+        that fails to open is logged and skipped.
+        """
+        pool = cls._get_connection_pool(credentials)
+        count = min(count, credentials.connection_pool_size) - pool.size()
+        if count <= 0:
+            return []
+
+        def _open_one(idx: int) -> Tuple[PooledConnection, float]:
+            start_time = time.time()
+            pooled = PooledConnection(cls._connect(credentials))
+            handle = ImpalaConnectionWrapper(pooled.handle, pooled=pooled)
+            ImpalaConnectionManager.fetch_impala_version(handle)
+            handle.close()
+            elapsed = time.time() - start_time
+            logger.debug(f"Pre-warmed connection {idx} in {elapsed:.2f} seconds")
+            return pooled, elapsed
+
+        prewarm_start_time = time.time()
+        timings = []
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix="impala-prewarm") as tpe:
+            futures = [tpe.submit(_open_one, idx) for idx in range(count)]
+            for future in futures:
+                try:
+                    pooled, elapsed = future.result()
+                except Exception as ex:
+                    logger.debug(f"Unable to pre-warm connection: {ex}")
+                    continue
+                pool.release(pooled)
+                timings.append(elapsed)
+
+        logger.debug(
+            f"Pre-warmed {len(timings)} of {count} connections in "
+            f"{time.time() - prewarm_start_time:.2f} seconds"
+        )
+        return timings
+
+    def _discard_thread_handle(self):
+        # a transport level failure leaves the handle in an unknown state, never pool it again
+        connection = self.get_if_exists()
+        if connection is not None and isinstance(connection.handle, ImpalaConnectionWrapper):
+            connection.handle.reusable = False
+
     @classmethod
     def close(cls, connection):
         try:
@@ -295,6 +588,14 @@ class ImpalaConnectionManager(SQLConnectionManager):
 
         logger.debug(f"IMPALA VERSION {'ImpalaConnectionManager.impala_version'}")
 
+    @classmethod
+    def impala_version_tuple(cls) -> Optional[Tuple[int, ...]]:
+        """The fetched impala version as (major, minor, patch), None if it is not known."""
+        match = IMPALA_VERSION_REGEX.search(ImpalaConnectionManager.impala_version or "")
+        if not match:
+            return None
+        return tuple(int(part) for part in match.groups(default="0"))
+
     @classmethod
     def get_response(cls, cursor) -> AdapterResponse:
         modified_rows, _ = cursor._cursor.rowcounts
@@ -311,10 +612,116 @@ class ImpalaConnectionManager(SQLConnectionManager):
         else:
             message = f"OK ({rows} rows)"
 
-        return AdapterResponse(_message=message, rows_affected=rows)
+        profile = getattr(cursor, "query_profile", None)
+        if profile is None:
+            return AdapterResponse(_message=message, rows_affected=rows)
+
+        return ImpalaAdapterResponse(
+            _message=message,
+            rows_affected=rows,
+            query_id=profile.query_id,
+            peak_memory_bytes=profile.peak_memory_bytes,
+            bytes_scanned=profile.bytes_scanned,
+            rows_produced=profile.rows_produced,
+            admission_wait_ms=profile.admission_wait_ms,
+            fragment_times_ms=profile.fragment_times_ms,
+            profile_path=profile.profile_path,
+        )
 
     def cancel(self, connection):
-        connection.handle.close()
+        handle = connection.handle
+        credentials = connection.credentials
+        # an async query is cancelled on the server by the thread polling it, leaving the
+        # connection usable. wait for at most one poll before tearing the handle down.
+        if credentials.execute_async and handle.request_cancel(
+            credentials.async_max_poll_interval + 1
+        ):
+            logger.debug(f"Cancelled running query on connection {connection.name}")
+            return
+
+        # the handle is torn down while a query may still be running on it
+        handle.reusable = False
+        handle.close()
+
+    def _execute_statement(self, connection, cursor, sql, bindings, configuration):
+        credentials = connection.credentials
+        if not credentials.execute_async:
+            cursor.execute(sql, bindings, configuration)
+        else:
+            self._execute_async(connection, cursor, sql, bindings, configuration)
+
+        if credentials.capture_query_profile:
+            self._capture_query_profile(connection, cursor)
+
+    def _execute_async(self, connection, cursor, sql, bindings, configuration):
+        credentials = connection.credentials
+
+        def _log_progress(elapsed: float):
+            logger.debug(
+                f"Query on connection {connection.name} running for {elapsed:.0f} seconds: "
+                f"{self._describe_progress(cursor)}"
+            )
+
+        cursor.execute_async(
+            sql,
+            bindings,
+            configuration,
+            poll_interval=credentials.async_poll_interval,
+            max_poll_interval=credentials.async_max_poll_interval,
+            on_progress=_log_progress,
+        )
+
+    @staticmethod
+    def _capture_query_profile(connection, cursor):
+        try:
+            profile = cursor.get_profile()
+        except Exception as ex:
+            logger.debug(f"Unable to fetch query profile: {ex}")
+            return
+
+        summary = parse_query_profile(profile)
+
+        profile_dir = connection.credentials.query_profile_dir
+        if profile_dir:
+            file_name = (summary.query_id or f"query_{time.time_ns()}").replace(":", "_")
+            summary.profile_path = os.path.join(profile_dir, f"{file_name}.txt")
+            try:
+                os.makedirs(profile_dir, exist_ok=True)
+                with open(summary.profile_path, "w", encoding="utf-8") as profile_file:
+                    profile_file.write(profile)
+            except OSError as ex:
+                logger.debug(f"Unable to write query profile to {summary.profile_path}: {ex}")
+                summary.profile_path = None
+
+        if cursor.query_profile is None:
+            cursor.query_profile = summary
+        else:
+            cursor.query_profile = cursor.query_profile.merge(summary)
+
+    @staticmethod
+    def _describe_progress(cursor) -> str:
+        try:
+            summary = cursor.get_summary()
+        except Exception as ex:
+            return f"progress unavailable ({ex})"
+
+        if summary is None:
+            return "progress unavailable"
+        if summary.is_queued:
+            return f"queued for admission: {summary.queued_reason}"
+
+        details = []
+        if summary.nodes:
+            # the first node is the root of the plan, its cardinality is the rows produced so far
+            root_stats = summary.nodes[0].exec_stats or []
+            details.append(f"{sum(stats.cardinality or 0 for stats in root_stats)} rows produced")
+        if summary.progress and summary.progress.total_scan_ranges:
+            progress = summary.progress
+            details.append(
+                f"{progress.num_completed_scan_ranges}/{progress.total_scan_ranges} scan ranges"
+                " completed"
+            )
+        return ", ".join(details) or "running"
 
     def add_begin_query(self, *args, **kwargs):
         logger.debug("NotImplemented: add_begin_query")
@@ -356,6 +763,7 @@ class ImpalaConnectionManager(SQLConnectionManager):
             pre = time.time()
 
             cursor = connection.handle.cursor()
+            cursor.query_profile = None
 
             # paramstyle parameter is needed for the datetime object to be correctly quoted when
             # running substitution query from impyla. this fix also depends on a patch for impyla:
@@ -363,15 +771,15 @@ class ImpalaConnectionManager(SQLConnectionManager):
             configuration = {"paramstyle": "format"}
             query_exception = None
             try:
-                statements = [stmt.strip() for stmt in sql.split(";") if stmt.strip()]
+                statements = split_statements(sql)
                 if len(statements) > 1:
                     logger.debug(
                         f"Detected multiple SQL statements ({len(statements)}), executing sequentially."
                     )
                     for stmt in statements:
-                        cursor.execute(stmt, bindings, configuration)
+                        self._execute_statement(connection, cursor, stmt, bindings, configuration)
                 else:
-                    cursor.execute(sql, bindings, configuration)
+                    self._execute_statement(connection, cursor, sql, bindings, configuration)
                 query_status = str(self.get_response(cursor))
             except Exception as ex:
                 query_status = str(ex)
@@ -392,6 +800,39 @@ class ImpalaConnectionManager(SQLConnectionManager):
 
             return connection, cursor
 
+    @classmethod
+    def get_result_from_cursor(cls, cursor: Any, limit: Optional[int]) -> "agate.Table":
+        from dbt_common.clients.agate_helper import table_from_data_flat
+
+        # rows are fetched in fetch_batch_size batches straight into the table instead of being
+        # materialized by fetchall first, the table itself still holds every row of the result
+        data: Iterator[Dict[str, Any]] = iter(())
+        column_names: List[str] = []
+
+        if cursor.description is not None:
+            column_names = [col[0] for col in cursor.description]
+            data = cls.process_results(column_names, cursor.iter_rows(limit=limit))
+
+        return table_from_data_flat(data, column_names)
+
+    def stream_results(
+        self, sql: str, batch_size: Optional[int] = None, limit: Optional[int] = None
+    ) -> Iterator[Tuple]:
+        """Execute sql and yield its result rows in batches of batch_size as they arrive.
+
+        The rows are read lazily from the cursor of the thread's connection, which every
+        statement shares: running another statement on the same thread before the iteration
+        is done ends the stream. A limit of None or 0 yields every row.
+        """
+        sql = self._add_query_comment(sql)
+        _, cursor = self.add_query(sql, auto_begin=False)
+        if cursor.description is None:
+            return
+        yield from cursor.iter_rows(batch_size=batch_size, limit=limit)
+
     @classmethod
     def data_type_code_to_name(cls, type_code) -> str:
         return type_code.split("(")[0].upper()
+
+
+atexit.register(ImpalaConnectionManager.close_connection_pools)
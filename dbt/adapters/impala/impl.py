@@ -12,15 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import re
+import shutil
+import threading
+import time
 from collections import OrderedDict
-from concurrent.futures import Future
-from typing import Any, Dict, Iterable, List, FrozenSet, Tuple
+from concurrent.futures import Future, as_completed
+from multiprocessing.context import SpawnContext
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, Iterator, List, FrozenSet, Set, Tuple, Union
 
 import agate
 import dbt.exceptions
 from dbt.adapters.base.impl import catch_as_completed
+from dbt.adapters.base.meta import available
+from dbt.adapters.base.relation import BaseRelation
+from dbt.adapters.capability import Capability, CapabilityDict, CapabilitySupport, Support
+from dbt.adapters.reference_keys import _make_ref_key, lowercase
 from dbt.adapters.sql import SQLAdapter
+from dbt.adapters.sql.impl import GET_COLUMNS_IN_RELATION_MACRO_NAME
 from dbt_common.clients import agate_helper
 from dbt_common.clients.agate_helper import ColumnTypeBuilder, NullableAgateType, _NullMarker
 from dbt.adapters.events.logging import AdapterLogger
@@ -30,8 +41,16 @@ from dbt.adapters.base.impl import ConstraintSupport
 from dbt_common.contracts.constraints import ConstraintType
 
 from dbt.adapters.impala import ImpalaConnectionManager
-from dbt.adapters.impala.column import ImpalaColumn
+from dbt.adapters.impala.connections import ImpalaAdapterResponse
+from dbt.adapters.impala.column import ImpalaCatalogColumn, ImpalaColumn
+from dbt.adapters.impala.metadata_cache import (
+    METADATA_CACHE_FILE_NAME,
+    NO_METADATA_CACHE_ENV_VAR,
+    ImpalaMetadataCache,
+    column_fingerprint,
+)
 from dbt.adapters.impala.relation import ImpalaRelation
+from dbt.adapters.impala import partition_overwrite, seed_loader
 
 from typing import Optional
 from dbt_common.contracts.constraints import (
@@ -44,11 +63,33 @@ logger = AdapterLogger("Impala")
 LIST_SCHEMAS_MACRO_NAME = "list_schemas"
 LIST_RELATIONS_MACRO_NAME = "list_relations_without_caching"
 LIST_TABLES_IN_RELATION_MACRO_NAME = "list_tables_in_relation"
+LIST_RELATIONS_FROM_INFORMATION_SCHEMA_MACRO_NAME = (
+    "impala__list_relations_from_information_schema"
+)
+LIST_COLUMNS_FROM_INFORMATION_SCHEMA_MACRO_NAME = "impala__list_columns_from_information_schema"
+SHOW_COLUMN_STATS_MACRO_NAME = "impala__show_column_stats"
 GET_RELATIONSHIP_TYPE_MACRO_NAME = "get_relation_type"
+# catalog columns kept as text by _catalog_filter_table, as in the default filter
+CATALOG_TEXT_COLUMNS = [
+    "table_database",
+    "table_schema",
+    "table_name",
+    "table_type",
+    "table_comment",
+    "table_owner",
+    "column_name",
+    "column_type",
+    "column_comment",
+]
 
 KEY_TABLE_OWNER = "Owner"
+DESCRIBE_PARTITION_TRANSFORM_HEADER = "# Partition Transform Information"
+DESCRIBE_TABLE_INFORMATION_HEADER = "# Detailed Table Information"
 KEY_TABLE_STATISTICS = "Statistics"
 
+# first release with information_schema.tables, older versions list tables and views separately
+INFORMATION_SCHEMA_MIN_VERSION = (4, 5)
+
 
 class ImpalaAdapter(SQLAdapter):
     Relation = ImpalaRelation
@@ -59,6 +100,10 @@ class ImpalaAdapter(SQLAdapter):
     INFORMATION_OWNER_REGEX = re.compile(r"^Owner: (.*)$", re.MULTILINE)
     INFORMATION_STATISTICS_REGEX = re.compile(r"^Statistics: (.*)$", re.MULTILINE)
 
+    _capabilities = CapabilityDict(
+        {Capability.SchemaMetadataByRelations: CapabilitySupport(support=Support.Full)}
+    )
+
     CONSTRAINT_SUPPORT = {
         ConstraintType.check: ConstraintSupport.NOT_SUPPORTED,
         ConstraintType.not_null: ConstraintSupport.NOT_SUPPORTED,
@@ -67,6 +112,70 @@ class ImpalaAdapter(SQLAdapter):
         ConstraintType.foreign_key: ConstraintSupport.ENFORCED,
     }
 
+    # cleared when a server turns out not to serve information_schema despite its version
+    _information_schema_listing_supported = True
+    _information_schema_columns_supported = True
+
+    def __init__(self, config, mp_context: SpawnContext) -> None:
+        super().__init__(config, mp_context)
+        self._cache_population_lock = threading.Lock()
+        # cached relations by lowercased (schema, identifier), kept next to self.cache
+        self._relation_index: Dict[Tuple[Optional[str], Optional[str]], BaseRelation] = {}
+        self._metadata_cache = self._open_metadata_cache(config)
+        # column_fingerprint of every relation by lowercased schema and identifier, read once per
+        # schema and invocation from information_schema to validate persisted metadata
+        self._schema_fingerprints: Dict[str, Dict[str, str]] = {}
+
+        if config.credentials.prewarm_connections:
+            self.connections.request_prewarm(config.threads)
+
+    @staticmethod
+    def _open_metadata_cache(config) -> Optional[ImpalaMetadataCache]:
+        credentials = config.credentials
+        if not credentials.metadata_cache or os.environ.get(NO_METADATA_CACHE_ENV_VAR):
+            return None
+
+        path = os.path.join(
+            getattr(config, "project_root", ""), config.target_path, METADATA_CACHE_FILE_NAME
+        )
+        try:
+            metadata_cache = ImpalaMetadataCache(path, credentials.metadata_cache_ttl)
+            metadata_cache.evict_expired()
+        except Exception as ex:
+            logger.debug(f"Unable to open the metadata cache at {path}, not using it: {ex}")
+            return None
+        return metadata_cache
+
+    def _forget_fingerprint(self, relation: BaseRelation) -> None:
+        with self._cache_population_lock:
+            fingerprints = self._schema_fingerprints.get(lowercase(relation.schema))
+            if fingerprints is not None:
+                fingerprints.pop(lowercase(relation.identifier), None)
+
+    def _persist_added_relation(self, relation: Optional[BaseRelation]) -> None:
+        if self._metadata_cache is None or relation is None:
+            return
+        self._forget_fingerprint(relation)
+        if relation.type is None:
+            # the listing can't be completed without the type, list the schema again next time
+            self._metadata_cache.evict_relation(relation.schema, relation.identifier)
+        else:
+            self._metadata_cache.put_relation(
+                relation.schema, {"identifier": relation.identifier, "type": relation.type}
+            )
+
+    def _persist_dropped_relation(self, relation: Optional[BaseRelation]) -> None:
+        if self._metadata_cache is None or relation is None:
+            return
+        self._forget_fingerprint(relation)
+        self._metadata_cache.remove_relation(relation.schema, relation.identifier)
+
+    @staticmethod
+    def _is_intermediate_relation(relation: BaseRelation) -> bool:
+        # __dbt_tmp, __dbt_backup, __dbt_seed_tmp... are not worth persisting and may be left
+        # over by a failed run, created by statements that never reach the relation cache
+        return "__dbt_" in (relation.identifier or "").lower()
+
     @classmethod
     def render_model_constraint(cls, constraint: ModelLevelConstraint) -> Optional[str]:
         column_list = ", ".join(constraint.columns)
@@ -111,6 +220,102 @@ class ImpalaAdapter(SQLAdapter):
         decimals = agate_table.aggregate(agate.MaxPrecision(col_idx))  # type: ignore[attr-defined]
         return "real" if decimals else "integer"
 
+    def _relations_cache_for_schemas(
+        self,
+        relation_configs: Iterable[RelationConfig],
+        cache_schemas: Optional[Set[BaseRelation]] = None,
+    ) -> None:
+        if not cache_schemas:
+            cache_schemas = self._get_cache_schemas(relation_configs)
+
+        # a dedicated pool size, listing schemas is cheap compared to running models
+        threads = self.config.credentials.cache_population_threads or self.config.threads
+        threading_config = SimpleNamespace(args=self.config.args, threads=threads)
+
+        with executor(threading_config) as tpe:
+            futures: List[Future[List[BaseRelation]]] = []
+            for cache_schema in cache_schemas:
+                futures.append(
+                    tpe.submit_connected(
+                        self,
+                        f"list_{cache_schema.database}_{cache_schema.schema}",
+                        self.list_relations_without_caching,
+                        cache_schema,
+                    )
+                )
+
+            for future in as_completed(futures):
+                # a schema that can't be listed fails the cache population
+                relations = future.result()
+                with self._cache_population_lock:
+                    for relation in relations:
+                        self.cache.add(relation)
+                        self._relation_index[self._relation_index_key(relation)] = relation
+
+        # schemas without relations are still known to be listed
+        self.cache.update_schemas(
+            {(relation.database, relation.schema) for relation in cache_schemas if relation.schema}
+        )
+
+    def set_relations_cache(
+        self,
+        relation_configs: Iterable[RelationConfig],
+        clear: bool = False,
+        required_schemas: Optional[Set[BaseRelation]] = None,
+    ) -> None:
+        if clear:
+            with self._cache_population_lock:
+                self._relation_index.clear()
+        super().set_relations_cache(relation_configs, clear, required_schemas)
+
+    @available
+    def cache_added(self, relation: Optional[BaseRelation]) -> str:
+        result = super().cache_added(relation)
+        self._persist_added_relation(relation)
+        with self._cache_population_lock:
+            self._relation_index[self._relation_index_key(relation)] = relation
+        return result
+
+    @available
+    def cache_dropped(self, relation: Optional[BaseRelation]) -> str:
+        result = super().cache_dropped(relation)
+        self._persist_dropped_relation(relation)
+        with self._cache_population_lock:
+            self._relation_index.pop(self._relation_index_key(relation), None)
+        return result
+
+    @available
+    def cache_renamed(
+        self, from_relation: Optional[BaseRelation], to_relation: Optional[BaseRelation]
+    ) -> str:
+        result = super().cache_renamed(from_relation, to_relation)
+        self._persist_dropped_relation(from_relation)
+        if to_relation is not None and to_relation.type is None and from_relation is not None:
+            to_relation = to_relation.incorporate(type=from_relation.type)
+        self._persist_added_relation(to_relation)
+        # the cache keeps its own copy of the renamed relation, with the information of the old one
+        cached = self.cache.relations.get(_make_ref_key(to_relation))
+        with self._cache_population_lock:
+            self._relation_index.pop(self._relation_index_key(from_relation), None)
+            if cached is not None:
+                self._relation_index[self._relation_index_key(to_relation)] = cached.inner
+        return result
+
+    @staticmethod
+    def _relation_index_key(relation: BaseRelation) -> Tuple[Optional[str], Optional[str]]:
+        return lowercase(relation.schema), lowercase(relation.identifier)
+
+    def _get_cached_relation(self, relation: BaseRelation) -> Optional[BaseRelation]:
+        cached_relation = self._relation_index.get(self._relation_index_key(relation))
+        if cached_relation is None:
+            return None
+        # relations can leave or be replaced in the cache without going through the adapter,
+        # e.g. the views dropped along with a table, so only trust entries the cache still holds
+        cached = self.cache.relations.get(_make_ref_key(cached_relation))
+        if cached is None or cached.inner is not cached_relation:
+            return None
+        return cached_relation
+
     def check_schema_exists(self, database, schema):
         results = self.execute_macro(LIST_SCHEMAS_MACRO_NAME, kwargs={"database": database})
 
@@ -143,8 +348,62 @@ class ImpalaAdapter(SQLAdapter):
     def list_relations_without_caching(
         self, schema_relation: ImpalaRelation
     ) -> List[ImpalaRelation]:
+        if not self._validates_persisted_metadata():
+            return self._list_relations_from_server(schema_relation)
+
+        persisted = self._metadata_cache.get_relations(schema_relation.schema)
+        if persisted is not None:
+            # column definitions are never persisted with the listing, they are read again along
+            # with the fingerprints that validate it
+            information = self._information_from_information_schema(schema_relation)
+            fingerprints = self._get_schema_fingerprints(schema_relation.schema)
+            if fingerprints is not None and set(fingerprints) == {
+                relation["identifier"].lower() for relation in persisted
+            }:
+                return [
+                    self.Relation.create(
+                        schema=schema_relation.schema,
+                        identifier=relation["identifier"],
+                        type=relation["type"],
+                        information=information.get(relation["identifier"].lower()),
+                    )
+                    for relation in persisted
+                ]
+            logger.debug(f"Relations of {schema_relation.schema} changed, listing them again")
+
+        relations = self._list_relations_from_server(schema_relation)
+        self._metadata_cache.put_relations(
+            schema_relation.schema,
+            [{"identifier": relation.identifier, "type": relation.type} for relation in relations],
+        )
+        return relations
+
+    def _list_relations_from_server(self, schema_relation: ImpalaRelation) -> List[ImpalaRelation]:
         kwargs = {"schema": schema_relation}
 
+        if self._use_information_schema_listing():
+            try:
+                result = self.execute_macro(
+                    LIST_RELATIONS_FROM_INFORMATION_SCHEMA_MACRO_NAME, kwargs=kwargs
+                )
+            except dbt.exceptions.DbtRuntimeError as e:
+                logger.debug(
+                    "Unable to list relations from information_schema, "
+                    f"falling back to show tables / show views: {getattr(e, 'msg', e)}"
+                )
+                ImpalaAdapter._information_schema_listing_supported = False
+            else:
+                information = self._information_from_information_schema(schema_relation)
+                return [
+                    self.Relation.create(
+                        schema=schema_relation.schema,
+                        identifier=row["name"],
+                        type="view" if "VIEW" in (row["table_type"] or "").upper() else "table",
+                        information=information.get(row["name"].lower()),
+                    )
+                    for row in result
+                ]
+
         try:
             result_tables = self.execute_macro(
                 "impala__list_tables_without_caching", kwargs=kwargs
@@ -158,27 +417,142 @@ class ImpalaAdapter(SQLAdapter):
                 logger.error(f"Unable to extract tables in relation {schema_relation}: {errmsg}")
                 raise e
 
-        result_tables_without_view = []
-        for row in result_tables:
-            # check if this table is view
-            is_view = len(list(filter(lambda x: x["name"] == row["name"], result_views))) == 1
-            if not is_view:
-                result_tables_without_view.append(row)
+        return self._relations_from_listing(schema_relation, result_tables, result_views)
+
+    def _information_from_information_schema(
+        self, schema_relation: ImpalaRelation
+    ) -> Dict[str, str]:
+        """Column definitions of every relation in the schema, in the format
+        parse_columns_from_information reads, keyed on the lowercased relation name.
+        """
+        if (
+            not self.config.credentials.bulk_column_metadata
+            or not ImpalaAdapter._information_schema_columns_supported
+        ):
+            return {}
+
+        try:
+            result = self.execute_macro(
+                LIST_COLUMNS_FROM_INFORMATION_SCHEMA_MACRO_NAME, kwargs={"schema": schema_relation}
+            )
+        except dbt.exceptions.DbtRuntimeError as e:
+            logger.debug(
+                "Unable to read columns from information_schema, "
+                f"columns will be described per relation: {getattr(e, 'msg', e)}"
+            )
+            ImpalaAdapter._information_schema_columns_supported = False
+            return {}
+
+        self._record_fingerprints(schema_relation.schema, result)
+
+        lines: Dict[str, List[str]] = {}
+        for row in result:
+            nullable = "false" if (row["is_nullable"] or "").upper() == "NO" else "true"
+            lines.setdefault(row["table_name"].lower(), []).append(
+                f" |-- {row['column_name']}: {row['data_type'].lower()} (nullable = {nullable})"
+            )
+        return {name: "\n".join(table_lines) + "\n" for name, table_lines in lines.items()}
+
+    def _record_fingerprints(self, schema: str, columns: agate.Table) -> Dict[str, str]:
+        by_relation: Dict[str, List[Tuple[str, str]]] = {}
+        for row in columns:
+            by_relation.setdefault(row["table_name"].lower(), []).append(
+                (row["column_name"] or "", row["data_type"] or "")
+            )
+        fingerprints = {
+            name: column_fingerprint(relation_columns)
+            for name, relation_columns in by_relation.items()
+        }
+        with self._cache_population_lock:
+            self._schema_fingerprints[schema.lower()] = fingerprints
+        return fingerprints
+
+    def _get_schema_fingerprints(self, schema: str) -> Optional[Dict[str, str]]:
+        """The column_fingerprint of every relation of schema, None when information_schema is
+        not available to read them from.
+        """
+        with self._cache_population_lock:
+            fingerprints = self._schema_fingerprints.get(schema.lower())
+        if fingerprints is not None:
+            return fingerprints
+
+        if (
+            not self._use_information_schema_listing()
+            or not ImpalaAdapter._information_schema_columns_supported
+        ):
+            return None
+
+        try:
+            result = self.execute_macro(
+                LIST_COLUMNS_FROM_INFORMATION_SCHEMA_MACRO_NAME,
+                kwargs={"schema": self.Relation.create(schema=schema)},
+            )
+        except dbt.exceptions.DbtRuntimeError as e:
+            logger.debug(f"Unable to read columns from information_schema: {getattr(e, 'msg', e)}")
+            ImpalaAdapter._information_schema_columns_supported = False
+            return None
+        return self._record_fingerprints(schema, result)
+
+    def _get_persisted_columns(self, relation: Relation) -> List[ImpalaColumn]:
+        persisted = self._metadata_cache.get_columns(relation.schema, relation.identifier)
+        if persisted is None:
+            return []
+
+        # served only when the relation still has the columns they were stored with
+        columns, fingerprint = persisted
+        fingerprints = self._get_schema_fingerprints(relation.schema) or {}
+        if fingerprints.get(relation.identifier.lower()) != fingerprint:
+            return []
+        return [ImpalaColumn.from_dict(column) for column in columns]
+
+    @available
+    def cache_columns_changed(self, relation: Optional[BaseRelation]) -> str:
+        """Forget the column definitions fetched for relation after its columns were altered."""
+        if relation is not None:
+            self._forget_fingerprint(relation)
+            if self._metadata_cache is not None:
+                self._metadata_cache.evict_columns(relation.schema, relation.identifier)
+            with self._cache_population_lock:
+                self._relation_index.pop(self._relation_index_key(relation), None)
+        return ""
+
+    def _validates_persisted_metadata(self) -> bool:
+        # persisted metadata is only used once checked against information_schema, which older
+        # versions don't serve
+        return (
+            self._metadata_cache is not None
+            and self._use_information_schema_listing()
+            and ImpalaAdapter._information_schema_columns_supported
+        )
+
+    def _use_information_schema_listing(self) -> bool:
+        if not ImpalaAdapter._information_schema_listing_supported:
+            return False
+        version = self.connections.impala_version_tuple()
+        return version is not None and version >= INFORMATION_SCHEMA_MIN_VERSION
+
+    @classmethod
+    def _relations_from_listing(
+        cls, schema_relation: ImpalaRelation, result_tables: agate.Table, result_views: agate.Table
+    ) -> List[ImpalaRelation]:
+        # show tables lists views as well, look them up in a set to keep this linear
+        view_names = {row["name"] for row in result_views}
 
         relations = []
 
-        for row in result_tables_without_view:
-            relations.append(
-                self.Relation.create(
-                    schema=schema_relation.schema,
-                    identifier=row["name"],
-                    type="table",
+        for row in result_tables:
+            if row["name"] not in view_names:
+                relations.append(
+                    cls.Relation.create(
+                        schema=schema_relation.schema,
+                        identifier=row["name"],
+                        type="table",
+                    )
                 )
-            )
 
         for row in result_views:
             relations.append(
-                self.Relation.create(
+                cls.Relation.create(
                     schema=schema_relation.schema,
                     identifier=row["name"],
                     type="view",
@@ -188,24 +562,34 @@ class ImpalaAdapter(SQLAdapter):
         return relations
 
     def get_columns_in_relation(self, relation: Relation) -> List[ImpalaColumn]:
-        cached_relations = self.cache.get_relations(relation.database, relation.schema)
-        cached_relation = next(
-            (
-                cached_relation
-                for cached_relation in cached_relations
-                if str(cached_relation) == str(relation)
-            ),
-            None,
-        )
+        return self._get_columns(relation, from_information=True)
+
+    def _get_columns(self, relation: Relation, from_information: bool) -> List[ImpalaColumn]:
+        # information read from information_schema has no comments, owner nor stats, the catalog
+        # skips it so that docs keep them
+        cached_relation = self._get_cached_relation(relation) if from_information else None
         columns = []
         if cached_relation and cached_relation.information:
             columns = self.parse_columns_from_information(cached_relation)
 
+        persistable = self._validates_persisted_metadata() and not self._is_intermediate_relation(
+            relation
+        )
+        if not columns and persistable:
+            columns = self._get_persisted_columns(relation)
+
         # execute the macro and parse the data
         if not columns:
             try:
                 rows: List[agate.Row] = super().get_columns_in_relation(relation)
                 columns = self.parse_describe_extended(relation, rows)
+                if columns and persistable:
+                    self._metadata_cache.put_columns(
+                        relation.schema,
+                        relation.identifier,
+                        [column.to_dict(omit_none=True) for column in columns],
+                        column_fingerprint((column.column, column.dtype) for column in columns),
+                    )
             except dbt.exceptions.DbtRuntimeError as e:
                 # impala would throw error when table doesn't exist
                 errmsg = getattr(e, "msg", "")
@@ -223,63 +607,11 @@ class ImpalaAdapter(SQLAdapter):
     def parse_describe_extended(
         self, relation: Relation, raw_rows: List[agate.Row]
     ) -> List[ImpalaColumn]:
-        # TODO: this method is largely from dbt-spark, sample test with impala works (test_dbt_base: base)
-        # need deeper testing
-
-        # Convert the Row to a dict
-        dict_rows = [dict(zip(row._keys, row._values)) for row in raw_rows]
-        # Find the separator between columns and partitions information
-        # by the DESCRIBE EXTENDED {{relation}} statement
-        partition_separator_pos = ImpalaAdapter.find_partition_information_separator(
-            dict_rows
-        )  # ensure that the class method is called
-
-        # Find the separator between the rows and the metadata provided
-        # by the DESCRIBE EXTENDED {{relation}} statement
-        table_separator_pos = ImpalaAdapter.find_table_information_separator(
-            dict_rows
-        )  # ensure that the class method is called
-
-        column_separator_pos = (
-            partition_separator_pos if partition_separator_pos > 0 else table_separator_pos
-        )
-        # Remove rows that start with a hash, they are comments
-        rows = [
-            row
-            for row in raw_rows[0:column_separator_pos]
-            if not row["name"].startswith("#") and not row["name"] == ""
-        ]
-
-        # Build metadata from DESCRIBE EXTENDED detail rows.
-        # Impala/Hive may put values in `type` OR `comment`, and table properties often appear as continuous rows with an empty `name`.
-        metadata: Dict[str, str] = {}
-        for col in raw_rows[table_separator_pos + 1 :]:
-            col_dict = dict(zip(col._keys, col._values))
-            name = (col_dict.get("name") or "").strip()
-            if name.startswith("#"):
-                continue
-
-            type_val = (col_dict.get("type") or "").strip()
-            comment_val = (col_dict.get("comment") or "").strip()
-
-            if name:
-                key = name.split(":")[0].strip()
-                if not key:
-                    continue
-                value = type_val or comment_val
-            else:
-                key = type_val
-                value = comment_val
+        columns, metadata = self._split_describe_extended(raw_rows)
 
-            if not key or not value:
-                continue
-            if value.upper() == "NULL":
-                continue
-
-            metadata[key] = value
-
-        raw_table_stats = metadata.get(KEY_TABLE_STATISTICS)
-        table_stats = ImpalaColumn.convert_table_stats(raw_table_stats)
+        table_stats = ImpalaColumn.convert_table_stats(metadata.get(KEY_TABLE_STATISTICS))
+        table_owner = str(metadata.get(KEY_TABLE_OWNER))
+        table_comment = metadata.get("comment")
 
         return [
             ImpalaColumn(
@@ -287,22 +619,77 @@ class ImpalaAdapter(SQLAdapter):
                 table_schema=relation.schema,
                 table_name=relation.name,
                 table_type=relation.type,
-                table_owner=str(metadata.get(KEY_TABLE_OWNER)),
+                table_owner=table_owner,
                 table_stats=table_stats,
-                column=column["name"],
+                column=name,
                 column_index=idx,
-                dtype=column["type"],
-                comment=column.get("comment"),
-                table_comment=metadata.get("comment"),
+                dtype=dtype,
+                comment=comment,
+                table_comment=table_comment,
             )
-            for idx, column in enumerate(rows)
+            for idx, (name, dtype, comment) in enumerate(columns)
         ]
 
+    @staticmethod
+    def _split_describe_extended(
+        raw_rows: List[agate.Row],
+    ) -> Tuple[List[Tuple[str, str, Optional[str]]], Dict[str, str]]:
+        # Single pass over the DESCRIBE EXTENDED {{relation}} rows: column rows come first, up to
+        # the partition transform (iceberg) or the detailed table information header, and the
+        # table metadata follows the latter.
+        columns: List[Tuple[str, str, Optional[str]]] = []
+        metadata: Dict[str, str] = {}
+
+        if raw_rows:
+            keys = raw_rows[0]._keys
+            name_idx = keys.index("name")
+            type_idx = keys.index("type")
+            comment_idx = keys.index("comment") if "comment" in keys else None
+
+        in_columns = True
+        in_metadata = False
+        for pos, row in enumerate(raw_rows):
+            values = row._values
+            name = values[name_idx] or ""
+
+            if in_metadata:
+                # Impala/Hive may put values in `type` OR `comment`, and table properties
+                # often appear as continuous rows with an empty `name`.
+                name = name.strip()
+                if name.startswith("#"):
+                    continue
+
+                type_val = (values[type_idx] or "").strip()
+                comment_val = (
+                    (values[comment_idx] or "").strip() if comment_idx is not None else ""
+                )
+
+                if name:
+                    key = name.split(":")[0].strip()
+                    value = type_val or comment_val
+                else:
+                    key = type_val
+                    value = comment_val
+
+                if key and value and value.upper() != "NULL":
+                    metadata[key] = value
+            elif name.startswith(DESCRIBE_TABLE_INFORMATION_HEADER):
+                in_columns = False
+                in_metadata = True
+            elif in_columns:
+                if pos > 0 and name.startswith(DESCRIBE_PARTITION_TRANSFORM_HEADER):
+                    in_columns = False
+                elif name and not name.startswith("#"):
+                    comment = values[comment_idx] if comment_idx is not None else None
+                    columns.append((name, values[type_idx], comment))
+
+        return columns, metadata
+
     @staticmethod
     def find_partition_information_separator(rows: List[dict]) -> int:
         pos = 0
         for row in rows:
-            if row["name"].startswith("# Partition Transform Information"):
+            if row["name"].startswith(DESCRIBE_PARTITION_TRANSFORM_HEADER):
                 break
             pos += 1
         result = 0 if (pos == len(rows)) else pos
@@ -312,7 +699,7 @@ class ImpalaAdapter(SQLAdapter):
     def find_table_information_separator(rows: List[dict]) -> int:
         pos = 0
         for row in rows:
-            if row["name"].startswith("# Detailed Table Information"):
+            if row["name"].startswith(DESCRIBE_TABLE_INFORMATION_HEADER):
                 break
             pos += 1
         return pos
@@ -348,33 +735,137 @@ class ImpalaAdapter(SQLAdapter):
     def get_catalog(
         self, relation_configs: Iterable[RelationConfig], used_schemas: FrozenSet[Tuple[str, str]]
     ):
+        # read twice below, once for the schemas and once for the identifiers
+        relation_configs = list(relation_configs)
         schema_map = self._get_catalog_schemas(relation_configs)
 
-        with executor(self.config) as tpe:
-            futures: List[Future[agate.Table]] = []
-            for info, schemas in schema_map.items():
-                for schema in schemas:
-                    futures.append(
-                        tpe.submit_connected(self, schema, self._get_one_catalog, info, [schema])
-                    )
-            catalogs, exceptions = catch_as_completed(futures)  # call the default implementation
-
-        return catalogs, exceptions
+        # only describe relations dbt knows about, not every table sharing a schema with them
+        identifiers_by_schema: Dict[str, Set[str]] = {}
+        for relation in self._get_catalog_relations(relation_configs):
+            if relation.schema and relation.identifier:
+                identifiers_by_schema.setdefault(relation.schema.lower(), set()).add(
+                    relation.identifier.lower()
+                )
 
-    def _get_one_catalog(self, information_schema, schemas) -> agate.Table:
-        if len(schemas) != 1:
-            dbt.exceptions.CompilationError(
-                f"Expected only one schema in ImpalaAdapter._get_one_catalog, found " f"{schemas}"
+        # listing and describing share the catalog_threads workers, one after the other
+        threads = self._catalog_threads()
+        with executor(SimpleNamespace(args=self.config.args, threads=threads)) as tpe:
+            listing_futures: List[Future[List[BaseRelation]]] = [
+                tpe.submit_connected(
+                    self,
+                    f"list_{schema}",
+                    self._list_catalog_relations,
+                    schema,
+                    identifiers_by_schema.get(schema.lower(), set()),
+                )
+                for schemas in schema_map.values()
+                for schema in schemas
+            ]
+            relations: List[BaseRelation] = []
+            exceptions: List[Exception] = []
+            for future in as_completed(listing_futures):
+                try:
+                    relations.extend(future.result())
+                except Exception as e:
+                    exceptions.append(e)
+
+            futures = self._submit_catalog_chunks(tpe, relations, threads)
+            catalogs, chunk_exceptions = catch_as_completed(
+                futures
+            )  # call the default implementation
+
+        return self._catalog_filter_table(catalogs, used_schemas), exceptions + chunk_exceptions
+
+    def _get_one_catalog_by_relations(
+        self,
+        information_schema,
+        relations: List[BaseRelation],
+        used_schemas: FrozenSet[Tuple[str, str]],
+    ) -> agate.Table:
+        # grouped like get_catalog, a schema may be spelled differently across relations
+        identifiers_by_schema: Dict[str, Set[str]] = {}
+        for relation in relations:
+            identifiers_by_schema.setdefault(relation.schema.lower(), set()).add(
+                relation.identifier.lower()
             )
 
-        schema = list(schemas)[0]
+        catalog_relations: List[BaseRelation] = []
+        for schema, identifiers in identifiers_by_schema.items():
+            catalog_relations.extend(self._list_catalog_relations(schema, identifiers))
+        return self._catalog_filter_table(
+            self._get_catalog_of_relations(catalog_relations), used_schemas
+        )
 
-        columns: List[Dict[str, Any]] = []
+    @classmethod
+    def _catalog_filter_table(
+        cls, table: agate.Table, used_schemas: FrozenSet[Tuple[str, str]]
+    ) -> agate.Table:
+        """Keep the rows of the used schemas like the default filter, whose rows and schemas
+        always have a database, which impala relations never do.
+        """
+        table = agate_helper.table_from_rows(
+            table.rows, table.column_names, text_only_columns=CATALOG_TEXT_COLUMNS
+        )
+        schemas = {schema.lower() for _, schema in used_schemas if schema is not None}
+        return table.where(
+            lambda row: row["table_schema"] is not None and row["table_schema"].lower() in schemas
+        )
+
+    def _catalog_threads(self) -> int:
+        return self.config.credentials.catalog_threads or self.config.threads
 
+    def _list_catalog_relations(
+        self, schema: str, identifiers: Optional[Set[str]] = None
+    ) -> List[BaseRelation]:
         relation_list = self.list_relations(None, schema)
+        if identifiers is None:
+            return relation_list
+        return [
+            relation
+            for relation in relation_list
+            if relation.identifier and relation.identifier.lower() in identifiers
+        ]
+
+    def _get_catalog_of_relations(self, relations: List[BaseRelation]) -> agate.Table:
+        """Catalog of relations, described by up to catalog_threads workers.
 
-        for relation in relation_list:
-            columns.extend(self._get_columns_for_catalog(relation))
+        Unlike get_catalog, the first relation that fails to be described fails the catalog.
+        """
+        threads = self._catalog_threads()
+        with executor(SimpleNamespace(args=self.config.args, threads=threads)) as tpe:
+            futures = self._submit_catalog_chunks(tpe, relations, threads)
+            catalogs = [future.result() for future in futures]
+        # empty chunks are skipped, their inferred column types would conflict with the others
+        return agate_helper.merge_tables([catalog for catalog in catalogs if len(catalog) > 0])
+
+    def _submit_catalog_chunks(
+        self, tpe, relations: List[BaseRelation], threads: int
+    ) -> List[Future[agate.Table]]:
+        """Split relations into one chunk per worker, each described on a single connection."""
+        chunks = [relations[idx::threads] for idx in range(min(threads, len(relations)))]
+        return [
+            tpe.submit_connected(self, f"catalog_{idx}", self._get_catalog_chunk, chunk)
+            for idx, chunk in enumerate(chunks)
+        ]
+
+    def _get_catalog_chunk(self, relations: List[BaseRelation]) -> agate.Table:
+        """Catalog of relations, described one after the other on the current connection."""
+        columns: List[ImpalaCatalogColumn] = []
+        for relation in relations:
+            relation_columns = self._get_columns_for_catalog(relation)
+            # views have no column stats, only tables
+            if (
+                self.config.credentials.catalog_column_stats
+                and relation.is_table
+                and relation_columns
+            ):
+                # all columns of the relation share the table metadata
+                table = relation_columns[0].table
+                table.table_stats = {
+                    **(table.table_stats or {}),
+                    **self._get_column_stats_for_catalog(relation),
+                }
+            columns.extend(relation_columns)
 
         if len(columns) > 0:
             text_types = agate_helper.build_type_tester(
@@ -383,22 +874,243 @@ class ImpalaAdapter(SQLAdapter):
         else:
             text_types = []
 
-        return agate.Table.from_object(columns, column_types=text_types)
+        # catalog rows are only expanded into dicts while the table is built
+        return agate.Table.from_object(
+            (column.to_column_dict() for column in columns), column_types=text_types
+        )
 
-    def _get_columns_for_catalog(self, relation: ImpalaRelation) -> Iterable[Dict[str, Any]]:
-        columns = self.get_columns_in_relation(relation)
+    def _get_columns_for_catalog(self, relation: ImpalaRelation) -> List[ImpalaCatalogColumn]:
+        return ImpalaCatalogColumn.from_columns(
+            self._get_columns(relation, from_information=False)
+        )
+
+    def _get_column_stats_for_catalog(self, relation: ImpalaRelation) -> Dict[str, Any]:
+        try:
+            rows = self.execute_macro(SHOW_COLUMN_STATS_MACRO_NAME, kwargs={"relation": relation})
+        except dbt.exceptions.DbtRuntimeError as e:
+            logger.debug(f"Unable to fetch column stats of {relation}: {getattr(e, 'msg', e)}")
+            return {}
+        return ImpalaColumn.convert_column_stats(rows)
+
+    @available
+    def stream_results(
+        self, sql: str, batch_size: Optional[int] = None, limit: Optional[int] = None
+    ) -> Iterator[Tuple]:
+        """Run sql and yield its rows in batches of fetch_batch_size instead of building a table.
+
+        The rows must be consumed before the next statement of the thread, which shares the cursor.
+        """
+        return self.connections.stream_results(sql, batch_size=batch_size, limit=limit)
+
+    @available
+    def get_seed_column_types(
+        self, agate_table: agate.Table, column_override: Optional[Dict[str, str]] = None
+    ) -> List[str]:
+        """The type every seed column is cast to, inferred once per seed rather than per row."""
+        column_override = column_override or {}
+        return [
+            column_override.get(column_name) or self.convert_type(agate_table, idx)
+            for idx, column_name in enumerate(agate_table.column_names)
+        ]
+
+    def _run_on_connections(
+        self, name: str, fn: Callable[..., Any], calls: List[Tuple], parallelism: int
+    ) -> Tuple[List[Any], List[Exception]]:
+        """Call fn with every argument tuple of calls, over up to parallelism connections.
+
+        With a parallelism of 1 the calls run in order on the connection of the calling node and
+        the first exception propagates. Otherwise the calls are split into one chunk per worker,
+        each run in order on a single connection, and the exceptions of the failed calls are
+        returned along with the results of the others.
+        """
+        if parallelism <= 1:
+            return [fn(*args) for args in calls], []
+
+        def _run_chunk(chunk: List[Tuple]) -> Tuple[List[Any], List[Exception]]:
+            chunk_results = []
+            chunk_exceptions = []
+            for args in chunk:
+                try:
+                    chunk_results.append(fn(*args))
+                except Exception as e:
+                    chunk_exceptions.append(e)
+            return chunk_results, chunk_exceptions
+
+        chunks = [calls[idx::parallelism] for idx in range(min(parallelism, len(calls)))]
+        results: List[Any] = []
+        exceptions: List[Exception] = []
+        threading_config = SimpleNamespace(args=self.config.args, threads=parallelism)
+        with executor(threading_config) as tpe:
+            futures = [
+                tpe.submit_connected(self, f"{name}_{idx}", _run_chunk, chunk)
+                for idx, chunk in enumerate(chunks)
+            ]
+            for future in as_completed(futures):
+                try:
+                    chunk_results, chunk_exceptions = future.result()
+                except Exception as e:
+                    # the connection of the chunk could not be acquired
+                    exceptions.append(e)
+                    continue
+                results.extend(chunk_results)
+                exceptions.extend(chunk_exceptions)
+        return results, exceptions
+
+    @available
+    def insert_seed_rows(
+        self,
+        relation: ImpalaRelation,
+        agate_table: agate.Table,
+        column_types: List[str],
+        batch_size: int,
+        parallelism: int = 1,
+        binding_char: str = "%s",
+        max_statement_bytes: Optional[int] = None,
+    ) -> str:
+        """Insert the seed in batches over up to parallelism connections.
+
+        Batches hold batch_size rows, or as many rows as fit max_statement_bytes when it is set.
+        Returns the statement of the first batch, for the seed's compiled code.
+        """
+        template = seed_loader.row_template(column_types, binding_char)
+        header = f"insert into {relation.render()} values "
+        rows = agate_table.rows
+        batches = seed_loader.plan_batches(
+            rows, batch_size, len(template), len(header), max_statement_bytes
+        )
+
+        def _insert_batch(batch: int, start: int, end: int) -> int:
+            sql = header + ",".join([template] * (end - start))
+            bindings = [value for row in rows[start:end] for value in row]
+            batch_start_time = time.time()
+            _, cursor = self.connections.add_query(sql, bindings=bindings, abridge_sql_log=True)
+            rows_affected = self.connections.get_response(cursor).rows_affected or 0
+            logger.debug(
+                f"Seed batch {batch + 1}/{len(batches)} of {relation}: {end - start} rows, "
+                f"{len(sql)} bytes before bindings, {time.time() - batch_start_time:.2f} seconds"
+            )
+            return rows_affected
+
+        load_start_time = time.time()
+        results, exceptions = self._run_on_connections(
+            f"seed_{relation.identifier}",
+            _insert_batch,
+            [(batch, start, end) for batch, (start, end) in enumerate(batches)],
+            parallelism,
+        )
+        inserted = sum(results)
+
+        if exceptions:
+            raise dbt.exceptions.DbtRuntimeError(
+                f"{len(exceptions)} of {len(batches)} seed batches failed to load into "
+                f"{relation}, first error: {exceptions[0]}"
+            )
+        logger.debug(
+            f"Inserted {inserted} rows into {relation} in {len(batches)} batches, "
+            f"{time.time() - load_start_time:.2f} seconds"
+        )
 
-        for column in columns:
-            # convert ImpalaColumns into catalog dicts
-            as_dict = column.to_column_dict()
+        first_batch = batches[0][1] if batches else 0
+        return header + ",".join([template] * first_batch)
+
+    @available
+    def overwrite_partitions(
+        self,
+        target: ImpalaRelation,
+        source: ImpalaRelation,
+        dest_columns: List[ImpalaColumn],
+        partition_by: Union[str, List[str]],
+        parallelism: int = 1,
+    ) -> ImpalaAdapterResponse:
+        """Overwrite the partitions of target that source holds rows for, one static partition
+        per statement and over up to parallelism connections.
+
+        Partitions of target missing from source are neither read nor written. Each partition is
+        replaced by its own statement, a failure leaves the partitions already rewritten as is.
+        """
+        partition_cols = partition_overwrite.partition_columns(partition_by)
+        partition_keys = {col.lower() for col in partition_cols}
+        select_cols = ", ".join(
+            column.name for column in dest_columns if column.name.lower() not in partition_keys
+        )
+
+        _, partitions = self.execute(
+            f"select distinct {', '.join(partition_cols)} from {source}", fetch=True
+        )
+        statements = [
+            partition_overwrite.overwrite_statement(
+                target, source, select_cols, partition_cols, row.values()
+            )
+            for row in partitions.rows
+        ]
 
-            as_dict["column_name"] = as_dict.pop("column", None)
-            as_dict["column_type"] = as_dict.pop("dtype")
-            as_dict["table_database"] = None
-            as_dict["column_comment"] = column.comment
-            as_dict["table_comment"] = column.table_comment
+        def _overwrite_partition(sql: str) -> int:
+            _, cursor = self.connections.add_query(sql)
+            return self.connections.get_response(cursor).rows_affected or 0
+
+        start_time = time.time()
+        results, exceptions = self._run_on_connections(
+            f"overwrite_{target.identifier}",
+            _overwrite_partition,
+            [(sql,) for sql in statements],
+            parallelism,
+        )
+        if exceptions:
+            raise dbt.exceptions.DbtRuntimeError(
+                f"{len(exceptions)} of {len(statements)} partitions of {target} failed to be "
+                f"overwritten, first error: {exceptions[0]}"
+            )
+        rows = sum(results)
+        logger.debug(
+            f"Overwrote {len(statements)} partitions of {target} with {rows} rows, "
+            f"{time.time() - start_time:.2f} seconds"
+        )
+        return ImpalaAdapterResponse(
+            _message=f"OK ({len(statements)} partitions, {rows} rows)",
+            rows_affected=rows,
+            partitions_rewritten=len(statements),
+        )
 
-            yield as_dict
+    @available
+    def stage_seed(self, agate_table: agate.Table, relation: ImpalaRelation) -> Dict[str, str]:
+        """Write the seed to a new directory under seed_staging_dir for a staging table to read.
+
+        Returns the local path of the directory and the location Impala reads it from.
+        """
+        credentials = self.config.credentials
+        if not credentials.seed_staging_dir:
+            raise dbt.exceptions.DbtRuntimeError(
+                "Seeds with load_mode 'bulk' require seed_staging_dir in the profile"
+            )
+
+        stage_name = seed_loader.new_stage_name(relation.schema, relation.identifier)
+        path = seed_loader.stage_path(credentials.seed_staging_dir, stage_name)
+        os.makedirs(path)
+        rows = seed_loader.write_delimited_file(
+            agate_table, os.path.join(path, seed_loader.DATA_FILE_NAME)
+        )
+        logger.debug(f"Staged {rows} rows of seed {relation} in {path}")
+
+        staging_location = credentials.seed_staging_location or credentials.seed_staging_dir
+        return {"path": path, "location": seed_loader.stage_location(staging_location, stage_name)}
+
+    @available
+    def drop_seed_stage(self, path: str) -> str:
+        shutil.rmtree(path, ignore_errors=True)
+        return ""
+
+    @available
+    def get_seed_content_hash(self, agate_table: agate.Table, column_types: List[str]) -> str:
+        return seed_loader.content_hash(agate_table, column_types)
+
+    @available
+    def get_table_property(self, relation: ImpalaRelation, key: str) -> Optional[str]:
+        """The value of a table property of relation, read from its describe extended output."""
+        rows = self.execute_macro(
+            GET_COLUMNS_IN_RELATION_MACRO_NAME, kwargs={"relation": relation}
+        )
+        _, metadata = self._split_describe_extended(rows)
+        return metadata.get(key)
 
     def timestamp_add_sql(self, add_to: str, number: int = 1, interval: str = "hour") -> str:
         # We override this from base dbt adapter because impala doesn't need to escape interval
@@ -469,4 +1181,4 @@ class ImpalaAdapter(SQLAdapter):
         """The set of standard builtin strategies which this adapter supports out-of-the-box.
         Not used to validate custom strategies defined by end users.
         """
-        return ["append", "insert_overwrite"]
+        return ["append", "insert_overwrite", "upsert", "merge"]
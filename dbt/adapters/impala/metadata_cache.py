@@ -0,0 +1,208 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+METADATA_CACHE_FILE_NAME = "impala_metadata_cache.sqlite"
+# set to any non empty value to bypass the metadata cache for a single invocation
+NO_METADATA_CACHE_ENV_VAR = "DBT_IMPALA_NO_METADATA_CACHE"
+
+_SCHEMA_VERSION = 3
+
+
+def column_fingerprint(columns: Iterable[Tuple[str, str]]) -> str:
+    """A digest of the (name, type) of the columns of a relation, to validate stored columns."""
+    digest = hashlib.sha1()
+    for name, dtype in columns:
+        digest.update(f"{name.lower()} {dtype.lower()};".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ImpalaMetadataCache:
+    """Relation listings and column definitions persisted across dbt invocations.
+
+    Entries expire after ttl seconds. Listings hold the identifier and type of every relation,
+    never their column definitions. Column entries are stored along with the
+    column_fingerprint of the relation, for callers to check against the current one before
+    using them. Column entries of a schema are also dropped as soon as a fresh listing of the
+    schema counts a different number of relations than the stored one, and callers update the
+    entries of relations they change themselves.
+    """
+
+    def __init__(self, path: str, ttl: float):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if self._db.execute("pragma user_version").fetchone()[0] != _SCHEMA_VERSION:
+            # written by another version of the adapter, start over
+            self._db.executescript(
+                """
+                drop table if exists relations;
+                drop table if exists columns;
+                """
+            )
+        self._db.executescript(
+            f"""
+            pragma journal_mode = wal;
+            pragma user_version = {_SCHEMA_VERSION};
+            create table if not exists relations (
+                schema_name text primary key,
+                relation_count integer not null,
+                payload text not null,
+                stored_at real not null
+            );
+            create table if not exists columns (
+                schema_name text not null,
+                identifier text not null,
+                payload text not null,
+                fingerprint text not null,
+                stored_at real not null,
+                primary key (schema_name, identifier)
+            );
+            """
+        )
+
+    @staticmethod
+    def _key(value: Optional[str]) -> str:
+        return (value or "").lower()
+
+    def _is_fresh(self, stored_at: float) -> bool:
+        return time.time() - stored_at < self.ttl
+
+    def get_relations(self, schema: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            row = self._db.execute(
+                "select payload, stored_at from relations where schema_name = ?",
+                (self._key(schema),),
+            ).fetchone()
+        if row is None or not self._is_fresh(row[1]):
+            return None
+        return json.loads(row[0])
+
+    def put_relations(self, schema: str, relations: List[Dict[str, Any]]) -> None:
+        key = self._key(schema)
+        with self._lock:
+            row = self._db.execute(
+                "select relation_count from relations where schema_name = ?", (key,)
+            ).fetchone()
+            if row is not None and row[0] != len(relations):
+                # relations were added or dropped outside of dbt, columns may have moved too
+                self._db.execute("delete from columns where schema_name = ?", (key,))
+            self._db.execute(
+                "insert or replace into relations values (?, ?, ?, ?)",
+                (key, len(relations), json.dumps(relations), time.time()),
+            )
+
+    def get_columns(
+        self, schema: str, identifier: str
+    ) -> Optional[Tuple[List[Dict[str, Any]], str]]:
+        """The stored columns of a relation along with their fingerprint."""
+        with self._lock:
+            row = self._db.execute(
+                "select payload, fingerprint, stored_at from columns "
+                "where schema_name = ? and identifier = ?",
+                (self._key(schema), self._key(identifier)),
+            ).fetchone()
+        if row is None or not self._is_fresh(row[2]):
+            return None
+        return json.loads(row[0]), row[1]
+
+    def put_columns(
+        self, schema: str, identifier: str, columns: List[Dict[str, Any]], fingerprint: str
+    ) -> None:
+        with self._lock:
+            self._db.execute(
+                "insert or replace into columns values (?, ?, ?, ?, ?)",
+                (
+                    self._key(schema),
+                    self._key(identifier),
+                    json.dumps(columns),
+                    fingerprint,
+                    time.time(),
+                ),
+            )
+
+    def _update_listing(self, key: str, identifier: str, relation: Optional[Dict[str, Any]]):
+        # must be called while holding the lock
+        row = self._db.execute(
+            "select payload from relations where schema_name = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return
+        relations = [
+            stored
+            for stored in json.loads(row[0])
+            if self._key(stored["identifier"]) != self._key(identifier)
+        ]
+        if relation is not None:
+            relations.append(relation)
+        self._db.execute(
+            "update relations set relation_count = ?, payload = ? where schema_name = ?",
+            (len(relations), json.dumps(relations), key),
+        )
+
+    def put_relation(self, schema: str, relation: Dict[str, Any]) -> None:
+        """Record a relation created or replaced by dbt in the listing of its schema."""
+        key = self._key(schema)
+        with self._lock:
+            self._update_listing(key, relation["identifier"], relation)
+            self._db.execute(
+                "delete from columns where schema_name = ? and identifier = ?",
+                (key, self._key(relation["identifier"])),
+            )
+
+    def remove_relation(self, schema: str, identifier: str) -> None:
+        """Remove a relation dropped by dbt from the listing of its schema."""
+        key = self._key(schema)
+        with self._lock:
+            self._update_listing(key, identifier, None)
+            self._db.execute(
+                "delete from columns where schema_name = ? and identifier = ?",
+                (key, self._key(identifier)),
+            )
+
+    def evict_columns(self, schema: str, identifier: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "delete from columns where schema_name = ? and identifier = ?",
+                (self._key(schema), self._key(identifier)),
+            )
+
+    def evict_relation(self, schema: str, identifier: str) -> None:
+        """Forget a relation changed by dbt, along with the listing of its schema."""
+        key = self._key(schema)
+        with self._lock:
+            self._db.execute("delete from relations where schema_name = ?", (key,))
+            self._db.execute(
+                "delete from columns where schema_name = ? and identifier = ?",
+                (key, self._key(identifier)),
+            )
+
+    def evict_expired(self) -> None:
+        threshold = time.time() - self.ttl
+        with self._lock:
+            self._db.execute("delete from relations where stored_at < ?", (threshold,))
+            self._db.execute("delete from columns where stored_at < ?", (threshold,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
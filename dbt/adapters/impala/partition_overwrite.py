@@ -0,0 +1,63 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import decimal
+from typing import Any, List, Sequence, Union
+
+
+def partition_columns(partition_by: Union[str, List[str]]) -> List[str]:
+    """The partition_by config as a list, it may be a comma separated string."""
+    if isinstance(partition_by, str):
+        return [col.strip() for col in partition_by.split(",") if col.strip()]
+    return list(partition_by)
+
+
+def partition_literal(value: Any) -> str:
+    """A partition value as a SQL literal, in a partition clause or a comparison."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, decimal.Decimal):
+        return format(value, "f")
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, datetime.datetime):
+        value = value.isoformat(sep=" ")
+    elif isinstance(value, datetime.date):
+        value = value.isoformat()
+    escaped = str(value).replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+def overwrite_statement(
+    target: Any,
+    source: Any,
+    select_cols: str,
+    partition_cols: Sequence[str],
+    values: Sequence[Any],
+) -> str:
+    """Overwrite the static partition of target at values with the matching rows of source."""
+    spec = ", ".join(
+        f"{col}={partition_literal(value)}" for col, value in zip(partition_cols, values)
+    )
+    predicate = " and ".join(
+        f"{col} is null" if value is None else f"{col} = {partition_literal(value)}"
+        for col, value in zip(partition_cols, values)
+    )
+    return (
+        f"insert overwrite {target} partition({spec}) "
+        f"select {select_cols} from {source} where {predicate}"
+    )
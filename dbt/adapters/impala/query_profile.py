@@ -0,0 +1,133 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+QUERY_ID_REGEX = re.compile(r"^Query \(id=([0-9a-f]+:[0-9a-f]+)\)", re.MULTILINE)
+NODE_PEAK_MEMORY_REGEX = re.compile(r"^\s*Per Node Peak Memory Usage:(.*)$", re.MULTILINE)
+# counters print their raw value in parentheses once it differs from the pretty printed one
+COUNTER_REGEX = re.compile(r"^\s*(?:- )?(\w+): (?:\S.*?\((\d+)\)|(\d+))\s*$")
+ADMISSION_REGEX = re.compile(r"^\s*- Completed admission: [^(]*\(([^)]+)\)")
+FRAGMENT_REGEX = re.compile(
+    r"^\s*(Coordinator Fragment|Averaged Fragment|Fragment) (F\d+):?\s*(?:\(Total: ([^,)]+))?"
+)
+MEMORY_REGEX = re.compile(r"\(([\d.]+) ([KMGTP]?B)\)")
+TIME_UNIT_REGEX = re.compile(r"([\d.]+)(h|ms|m|s|us|ns)")
+
+MEMORY_UNITS = {"B": 1, "KB": 1 << 10, "MB": 1 << 20, "GB": 1 << 30, "TB": 1 << 40, "PB": 1 << 50}
+TIME_UNITS_MS = {"h": 3600000.0, "m": 60000.0, "s": 1000.0, "ms": 1.0, "us": 1e-3, "ns": 1e-6}
+
+
+def parse_duration_ms(value: str) -> float:
+    """Convert an Impala pretty printed duration like 1m2s345ms or 12.5us to milliseconds."""
+    return sum(
+        float(amount) * TIME_UNITS_MS[unit] for amount, unit in TIME_UNIT_REGEX.findall(value)
+    )
+
+
+@dataclass
+class QueryProfileSummary:
+    query_id: Optional[str] = None
+    peak_memory_bytes: Optional[int] = None
+    bytes_scanned: Optional[int] = None
+    rows_produced: Optional[int] = None
+    admission_wait_ms: Optional[float] = None
+    fragment_times_ms: Dict[str, float] = field(default_factory=dict)
+    profile_path: Optional[str] = None
+
+    def merge(self, other: "QueryProfileSummary") -> "QueryProfileSummary":
+        """Combine the summaries of statements executed one after the other."""
+
+        def _add(left, right):
+            return right if left is None else left if right is None else left + right
+
+        fragment_times_ms = dict(self.fragment_times_ms)
+        for fragment, elapsed in other.fragment_times_ms.items():
+            fragment_times_ms[fragment] = fragment_times_ms.get(fragment, 0.0) + elapsed
+
+        return QueryProfileSummary(
+            query_id=other.query_id or self.query_id,
+            peak_memory_bytes=max(
+                (v for v in (self.peak_memory_bytes, other.peak_memory_bytes) if v is not None),
+                default=None,
+            ),
+            bytes_scanned=_add(self.bytes_scanned, other.bytes_scanned),
+            rows_produced=_add(self.rows_produced, other.rows_produced),
+            admission_wait_ms=_add(self.admission_wait_ms, other.admission_wait_ms),
+            fragment_times_ms=fragment_times_ms,
+            profile_path=other.profile_path or self.profile_path,
+        )
+
+
+def parse_query_profile(profile: str) -> QueryProfileSummary:
+    """Extract the headline numbers from the text runtime profile of a query.
+
+    Counters of averaged fragments are skipped so scan counters of every instance are only
+    counted once.
+    """
+    summary = QueryProfileSummary()
+
+    query_id_match = QUERY_ID_REGEX.search(profile)
+    if query_id_match:
+        summary.query_id = query_id_match.group(1)
+
+    node_memory_match = NODE_PEAK_MEMORY_REGEX.search(profile)
+    if node_memory_match:
+        node_peaks = [
+            int(float(amount) * MEMORY_UNITS[unit])
+            for amount, unit in MEMORY_REGEX.findall(node_memory_match.group(1))
+        ]
+        summary.peak_memory_bytes = max(node_peaks, default=None)
+
+    counters: Dict[str, int] = {}
+    in_averaged_fragment = False
+    for line in profile.splitlines():
+        fragment_match = FRAGMENT_REGEX.match(line)
+        if fragment_match:
+            kind, fragment, total = fragment_match.groups()
+            in_averaged_fragment = kind == "Averaged Fragment"
+            if kind != "Fragment" and total:
+                summary.fragment_times_ms[fragment] = parse_duration_ms(total)
+            continue
+
+        admission_match = ADMISSION_REGEX.match(line)
+        if admission_match:
+            summary.admission_wait_ms = parse_duration_ms(admission_match.group(1))
+            continue
+
+        if in_averaged_fragment:
+            continue
+
+        counter_match = COUNTER_REGEX.match(line)
+        if counter_match:
+            name, raw_value, value = counter_match.groups()
+            value = raw_value or value
+            if name in ("BytesRead", "NumModifiedRows", "NumRowsFetched", "PeakMemoryUsage"):
+                if name == "PeakMemoryUsage":
+                    counters[name] = max(counters.get(name, 0), int(value))
+                else:
+                    counters[name] = counters.get(name, 0) + int(value)
+
+    if "BytesRead" in counters:
+        summary.bytes_scanned = counters["BytesRead"]
+    if "NumModifiedRows" in counters:
+        summary.rows_produced = counters["NumModifiedRows"]
+    elif "NumRowsFetched" in counters:
+        summary.rows_produced = counters["NumRowsFetched"]
+    if summary.peak_memory_bytes is None and "PeakMemoryUsage" in counters:
+        summary.peak_memory_bytes = counters["PeakMemoryUsage"]
+
+    return summary
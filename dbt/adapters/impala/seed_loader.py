@@ -0,0 +1,149 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import decimal
+import hashlib
+import json
+import os
+import uuid
+from typing import Any, List, Optional, Sequence, Tuple
+
+import agate
+
+# the text table format the staging table is declared with, see impala__load_csv_rows_bulk
+FIELD_DELIMITER = ","
+ESCAPE_CHAR = "\\"
+NULL_MARKER = "\\N"
+DATA_FILE_NAME = "data.txt"
+
+_ESCAPES = str.maketrans(
+    {
+        ESCAPE_CHAR: ESCAPE_CHAR + ESCAPE_CHAR,
+        FIELD_DELIMITER: ESCAPE_CHAR + FIELD_DELIMITER,
+        "\n": ESCAPE_CHAR + "\n",
+        "\r": ESCAPE_CHAR + "\r",
+    }
+)
+
+
+def format_value(value: Any) -> str:
+    """Render a seed value the way Impala casts it back from a string column."""
+    if value is None:
+        return NULL_MARKER
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, decimal.Decimal):
+        # no exponent notation, cast('1E+2' as int) is null
+        return format(value, "f")
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value).translate(_ESCAPES)
+
+
+def write_delimited_file(agate_table: agate.Table, path: str) -> int:
+    """Write the rows of agate_table to path as delimited text, returns the number of rows."""
+    with open(path, "w", encoding="utf-8", newline="\n") as data_file:
+        for row in agate_table.rows:
+            data_file.write(FIELD_DELIMITER.join(format_value(value) for value in row))
+            data_file.write("\n")
+    return len(agate_table.rows)
+
+
+def content_hash(agate_table: agate.Table, column_types: List[str]) -> str:
+    """A sha256 of the seed's columns, the types they are cast to and its rows."""
+    digest = hashlib.sha256()
+    header = {"columns": list(agate_table.column_names), "column_types": list(column_types)}
+    digest.update(json.dumps(header).encode("utf-8"))
+    for row in agate_table.rows:
+        # values are escaped, so the encoding of a row is unambiguous
+        digest.update(b"\n")
+        digest.update(FIELD_DELIMITER.join(format_value(value) for value in row).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def new_stage_name(schema: str, identifier: str) -> str:
+    """A directory name unique to one load of one seed."""
+    return f"{schema}__{identifier}__{uuid.uuid4().hex}"
+
+
+def stage_location(staging_location: str, stage_name: str) -> str:
+    return f"{staging_location.rstrip('/')}/{stage_name}"
+
+
+def stage_path(staging_dir: str, stage_name: str) -> str:
+    return os.path.join(staging_dir, stage_name)
+
+
+def row_template(column_types: List[str], binding_char: str = "%s") -> str:
+    """The values clause of one seed row, each binding cast to the type of its column."""
+    return (
+        "("
+        + ",".join(f"cast({binding_char} as {column_type})" for column_type in column_types)
+        + ")"
+    )
+
+
+def estimate_binding_bytes(value: Any) -> int:
+    """Size of a value once the client substitutes it into the statement as a literal."""
+    if value is None:
+        return 4  # NULL
+    if isinstance(value, str):
+        # quotes, plus a backslash for every quote or backslash that needs escaping
+        return len(value.encode("utf-8")) + 2 + value.count("'") + value.count("\\")
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return len(str(value)) + 2
+    return len(str(value))
+
+
+def plan_batches(
+    rows: Sequence[Sequence[Any]],
+    batch_size: int,
+    template_bytes: int,
+    header_bytes: int,
+    max_statement_bytes: Optional[int] = None,
+) -> List[Tuple[int, int]]:
+    """Split rows into [start, end) batches.
+
+    Without max_statement_bytes every batch holds batch_size rows. With it, a batch grows until
+    the estimated rendered statement would exceed max_statement_bytes, whatever its row count.
+    A single row larger than the limit still gets a batch of its own.
+    """
+    if not max_statement_bytes:
+        return [
+            (start, min(start + batch_size, len(rows)))
+            for start in range(0, len(rows), batch_size)
+        ]
+
+    # every binding of the template is replaced by its literal
+    binding_bytes = 2
+    batches = []
+    start = 0
+    statement_bytes = header_bytes
+    for idx, row in enumerate(rows):
+        row_bytes = (
+            template_bytes
+            + 1
+            + sum(estimate_binding_bytes(value) - binding_bytes for value in row)
+        )
+        if idx > start and statement_bytes + row_bytes > max_statement_bytes:
+            batches.append((start, idx))
+            start = idx
+            statement_bytes = header_bytes
+        statement_bytes += row_bytes
+    if start < len(rows):
+        batches.append((start, len(rows)))
+    return batches
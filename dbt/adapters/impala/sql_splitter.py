@@ -0,0 +1,74 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from functools import lru_cache
+from typing import Tuple
+
+SPLIT_CACHE_SIZE = 256
+
+# Tokens that can contain or are a statement separator. Everything else is plain SQL text.
+# Unterminated quotes and block comments run to the end of the input, like they do in Impala.
+_TOKEN_REGEX = re.compile(
+    r"'(?:[^'\\]|\\.)*'?"  # single quoted string, backslash escapes
+    r'|"(?:[^"\\]|\\.)*"?'  # double quoted string, backslash escapes
+    r"|`[^`]*`?"  # quoted identifier
+    r"|--[^\n]*"  # line comment
+    r"|/\*.*?(?:\*/|\Z)"  # block comment
+    r"|;",
+    re.DOTALL,
+)
+
+
+@lru_cache(maxsize=SPLIT_CACHE_SIZE)
+def _split(sql: str) -> Tuple[str, ...]:
+    statements = []
+    start = 0
+    pos = 0
+    has_code = False
+
+    for match in _TOKEN_REGEX.finditer(sql):
+        token_start = match.start()
+        if not has_code and token_start > pos and not sql[pos:token_start].isspace():
+            has_code = True
+
+        token = match.group()
+        if token == ";":
+            # segments holding only whitespace and comments are not statements
+            if has_code:
+                statements.append(sql[start:token_start].strip())
+            start = match.end()
+            has_code = False
+        elif token[0] in "'\"`":
+            has_code = True
+
+        pos = match.end()
+
+    if has_code or (pos < len(sql) and not sql[pos:].isspace()):
+        statements.append(sql[start:].strip())
+
+    return tuple(statements)
+
+
+def split_statements(sql: str) -> Tuple[str, ...]:
+    """Split sql into the statements separated by top level semicolons.
+
+    Semicolons inside string literals, quoted identifiers and comments are not
+    separators, and segments made only of comments are dropped. Results are
+    cached, so statements that dbt renders repeatedly are only tokenized once.
+    """
+    if ";" not in sql:
+        # nothing to split, don't spend a cache slot on it
+        return (sql.strip(),) if sql.strip() else ()
+    return _split(sql)
@@ -170,6 +170,25 @@
   {% do return(load_result('list_views_without_caching').table) %}
 {% endmacro %}
 
+{% macro impala__list_relations_from_information_schema(schema) %}
+  {% call statement('list_relations_from_information_schema', fetch_result=True) -%}
+    select table_name as name, table_type
+    from information_schema.tables
+    where table_schema = '{{ schema.schema | lower }}'
+  {% endcall %}
+  {% do return(load_result('list_relations_from_information_schema').table) %}
+{% endmacro %}
+
+{% macro impala__list_columns_from_information_schema(schema) %}
+  {% call statement('list_columns_from_information_schema', fetch_result=True) -%}
+    select table_name, column_name, data_type, is_nullable
+    from information_schema.columns
+    where table_schema = '{{ schema.schema | lower }}'
+    order by table_name, ordinal_position
+  {% endcall %}
+  {% do return(load_result('list_columns_from_information_schema').table) %}
+{% endmacro %}
+
 {% macro impala__table_option_clauses() -%}
   {%- set table_type = config.get('table_type') -%}
   {%- set stored_as = config.get('stored_as', none) -%}
@@ -377,10 +396,23 @@
   {% do return(load_result('get_columns_in_relation').table) %}
 {% endmacro %}
 
+{% macro impala__show_column_stats(relation) -%}
+  {% call statement('show_column_stats', fetch_result=True) %}
+    show column stats {{ relation }}
+  {% endcall %}
+  {% do return(load_result('show_column_stats').table) %}
+{% endmacro %}
+
 {% macro impala__alter_column_type(relation, column_name, new_column_type) -%}
   {% call statement('alter_column_type') %}
     alter table {{ relation }} change {{ column_name }} {{ column_name }} {{ new_column_type }}
   {% endcall %}
+  {% do adapter.cache_columns_changed(relation) %}
+{% endmacro %}
+
+{% macro impala__alter_relation_add_remove_columns(relation, add_columns, remove_columns) -%}
+  {% do default__alter_relation_add_remove_columns(relation, add_columns, remove_columns) %}
+  {% do adapter.cache_columns_changed(relation) %}
 {% endmacro %}
 
 {% macro impala__truncate_relation(relation) -%}
@@ -17,10 +17,10 @@
 {% macro validate_get_incremental_strategy(incremental_strategy) %}
   {% set invalid_strategy_msg -%}
     Invalid incremental strategy provided: {{ incremental_strategy }}
-    Expected one of: 'append', 'insert_overwrite', 'microbatch'
+    Expected one of: 'append', 'insert_overwrite', 'microbatch', 'upsert', 'merge'
   {%- endset %}
 
-  {% if incremental_strategy not in ['append', 'insert_overwrite', 'microbatch'] %}
+  {% if incremental_strategy not in ['append', 'insert_overwrite', 'microbatch', 'upsert', 'merge'] %}
     {% do exceptions.raise_compiler_error(invalid_strategy_msg) %}
   {% endif %}
 
@@ -28,6 +28,18 @@
     {{ validate_partition_key_for_microbatch_strategy() }}
   {%- endif -%}
 
+  {% if incremental_strategy == 'upsert' %}
+    {{ validate_kudu_table_for_upsert_strategy() }}
+  {%- endif -%}
+
+  {% if incremental_strategy == 'merge' %}
+    {{ validate_iceberg_table_for_merge_strategy() }}
+  {%- endif -%}
+
+  {% if config.get('partition_overwrite_mode', 'dynamic') not in ['dynamic', 'static'] %}
+    {% do exceptions.raise_compiler_error("Invalid partition_overwrite_mode provided: " ~ config.get('partition_overwrite_mode') ~ ", expected one of: 'dynamic', 'static'") %}
+  {% endif %}
+
   {% do return(incremental_strategy) %}
 {% endmacro %}
 
@@ -42,6 +54,47 @@
     {%- endif -%}
 {% endmacro %}
 
+{% macro validate_kudu_table_for_upsert_strategy() %}
+    {% set upsert_not_kudu_msg -%}
+      dbt-impala 'upsert' incremental strategy is only supported for Kudu tables.
+      Set `stored_as='kudu'` and a `primary_key`, rows are matched on the primary key.
+    {%- endset %}
+
+    {%- if config.get('stored_as') != 'kudu' -%}
+      {{ exceptions.raise_compiler_error(upsert_not_kudu_msg) }}
+    {%- endif -%}
+{% endmacro %}
+
+{% macro validate_iceberg_table_for_merge_strategy() %}
+    {% set merge_not_iceberg_msg -%}
+      dbt-impala 'merge' incremental strategy is only supported for Iceberg v2 tables.
+      Set `table_type='iceberg'` and `tbl_properties="('format-version'='2')"`.
+    {%- endset %}
+    {% set merge_unique_key_missing_msg -%}
+      dbt-impala 'merge' incremental strategy requires a `unique_key` config.
+    {%- endset %}
+
+    {%- if config.get('table_type') != 'iceberg' -%}
+      {{ exceptions.raise_compiler_error(merge_not_iceberg_msg) }}
+    {%- endif -%}
+    {%- if not config.get('unique_key') -%}
+      {{ exceptions.raise_compiler_error(merge_unique_key_missing_msg) }}
+    {%- endif -%}
+{% endmacro %}
+
+{# static mode overwrites the partitions of the temp relation one by one, see
+   ImpalaAdapter.overwrite_partitions, instead of a single dynamic partition insert overwrite.
+   Every partition is its own statement: when one fails the model fails, but the partitions
+   already rewritten keep the new rows while the others keep the old ones until the next run. #}
+{% macro impala__use_static_partition_overwrite(incremental_strategy) %}
+    {{ return(
+        incremental_strategy == 'insert_overwrite'
+        and config.get('partition_overwrite_mode', 'dynamic') == 'static'
+        and config.get('partition_by') is not none
+        and config.get('table_type') != 'iceberg'
+    ) }}
+{% endmacro %}
+
 {% macro incremental_validate_on_schema_change(on_schema_change, default='ignore') %}
    {% if on_schema_change not in ['fail', 'ignore'] %}
      {% set log_message = 'Invalid value for on_schema_change (%s) specified. Setting default value of %s.' % (on_schema_change, default) %}
@@ -56,9 +109,73 @@
 {% endmacro %}
 
 {% macro impala__get_incremental_default_sql(arg_dict) %}
+   {% if config.get('incremental_strategy') == 'upsert' %}
+     {% do return(get_upsert_sql(arg_dict["target_relation"], arg_dict["temp_relation"], arg_dict["dest_columns"])) %}
+   {% endif %}
+   {% if config.get('incremental_strategy') == 'merge' %}
+     {% do return(get_merge_sql(arg_dict["target_relation"], arg_dict["temp_relation"], arg_dict["unique_key"], arg_dict["dest_columns"], arg_dict["predicates"])) %}
+   {% endif %}
    {% do return(get_insert_overwrite_sql(arg_dict["target_relation"], arg_dict["temp_relation"], arg_dict["dest_columns"])) %}
 {% endmacro %}
 
+{# kudu inserts the rows of source whose primary key is new and updates the others in place #}
+{% macro get_upsert_sql(target, source, dest_columns) -%}
+    {%- set dest_cols_csv = dest_columns | map(attribute="name") | join(", ") -%}
+
+    upsert into {{ target }} ({{ dest_cols_csv }})
+    select {{ dest_cols_csv }}
+    from {{ source }}
+{%- endmacro %}
+
+{# matches the rows of source to the rows of the iceberg v2 target on unique_key, narrowed by
+   incremental_predicates, which refer to the target as DBT_INTERNAL_DEST #}
+{% macro impala__get_merge_sql(target, source, unique_key, dest_columns, incremental_predicates=none) -%}
+    {%- set predicates = [] if incremental_predicates is none else [] + incremental_predicates -%}
+    {%- set unique_keys = [unique_key] if unique_key is string else unique_key -%}
+    {%- for key in unique_keys -%}
+        {%- do predicates.append("DBT_INTERNAL_SOURCE." ~ key ~ " = DBT_INTERNAL_DEST." ~ key) -%}
+    {%- endfor -%}
+
+    {#-- keys are equal on matched rows, they are not updated. Columns are compared by their
+         unquoted, lowercased names and quoted with backticks, as ImpalaColumn.quoted would use
+         double quotes that Impala reads as string literals --#}
+    {%- set merge_update_columns = config.get('merge_update_columns') -%}
+    {%- set merge_exclude_columns = config.get('merge_exclude_columns') -%}
+    {%- if merge_update_columns and merge_exclude_columns -%}
+        {{ exceptions.raise_compiler_error('Model cannot specify merge_update_columns and merge_exclude_columns. Please update model to use only one config') }}
+    {%- endif -%}
+    {%- set skipped = unique_keys | map("lower") | list + (merge_exclude_columns or []) | map("lower") | list -%}
+    {%- set update_columns = [] -%}
+    {%- for column_name in merge_update_columns or dest_columns | map(attribute="name") | list -%}
+        {%- set name = column_name | replace("`", "") -%}
+        {%- if name | lower not in skipped -%}
+            {%- do update_columns.append(adapter.quote(name)) -%}
+        {%- endif -%}
+    {%- endfor -%}
+    {%- set insert_columns = [] -%}
+    {%- for column in dest_columns -%}
+        {%- do insert_columns.append(adapter.quote(column.name)) -%}
+    {%- endfor -%}
+
+    merge into {{ target }} DBT_INTERNAL_DEST
+    using {{ source }} DBT_INTERNAL_SOURCE
+    on {{ predicates | join(" and ") }}
+    {% if update_columns -%}
+    when matched then update set
+        {% for column in update_columns -%}
+            {{ column }} = DBT_INTERNAL_SOURCE.{{ column }}
+            {%- if not loop.last %}, {% endif %}
+        {%- endfor %}
+    {% endif -%}
+    when not matched then insert ({{ insert_columns | join(", ") }})
+    values (
+        {%- for column in insert_columns -%}
+            DBT_INTERNAL_SOURCE.{{ column }}
+            {%- if not loop.last %}, {% endif %}
+        {%- endfor -%}
+    )
+{%- endmacro %}
+
 {% materialization incremental, adapter='impala' -%}
 
   -- relations
@@ -70,19 +187,19 @@
   {%- set backup_relation = make_backup_relation(target_relation, backup_relation_type) -%}
 
   -- configs
-  {% set unique_key = config.get('unique_key') %}
-  {% set uniquekey_msg -%}
-    Impala adapter does not support 'unique_key'
-  {%- endset %}
-  {% if unique_key is not none %}
-    {% do exceptions.raise_compiler_error(uniquekey_msg) %}
-  {% endif %}
-
   {% set incremental_strategy = config.get('incremental_strategy') or 'append' %}
   {% if incremental_strategy == None %}
     {% set incremental_strategy = 'append' %}
   {% endif %}
   {% set incremental_strategy = validate_get_incremental_strategy(incremental_strategy) %}
+
+  {% set unique_key = config.get('unique_key') %}
+  {% set uniquekey_msg -%}
+    Impala adapter only supports 'unique_key' with the 'merge' strategy of Iceberg tables, the 'upsert' strategy of Kudu tables matches rows on their primary key
+  {%- endset %}
+  {% if unique_key is not none and incremental_strategy != 'merge' %}
+    {% do exceptions.raise_compiler_error(uniquekey_msg) %}
+  {% endif %}
   {%- set full_refresh_mode = (should_full_refresh()  or existing_relation.is_view) -%}
   {% set on_schema_change = incremental_validate_on_schema_change(config.get('on_schema_change'), default='ignore') %}
 
@@ -106,6 +223,7 @@
   {{ run_hooks(pre_hooks, inside_transaction=True) }}
 
   {% set to_drop = [] %}
+  {% set static_partition_overwrite = false %}
 
   {% if existing_relation is none %}
       {% set build_sql = get_create_table_as_sql(False, target_relation, sql) %}
@@ -128,12 +246,24 @@
     {% set incremental_predicates = config.get('incremental_predicates', none) %}
     {% set strategy_arg_dict = ({'target_relation': target_relation, 'temp_relation': temp_relation, 'unique_key': unique_key, 'dest_columns': dest_columns, 'predicates': incremental_predicates }) %}
     {% set build_sql = get_incremental_default_sql(strategy_arg_dict) %}
+    {% set static_partition_overwrite = impala__use_static_partition_overwrite(incremental_strategy) %}
 
   {% endif %}
 
-  {% call statement("main") %}
-      {{ build_sql }}
-  {% endcall %}
+  {% if static_partition_overwrite %}
+      {% set response = adapter.overwrite_partitions(
+          target_relation,
+          temp_relation,
+          dest_columns,
+          config.get('partition_by'),
+          config.get('partition_overwrite_parallelism', 1) | int
+      ) %}
+      {% do store_result('main', response=response) %}
+  {% else %}
+    {% call statement("main") %}
+        {{ build_sql }}
+    {% endcall %}
+  {% endif %}
 
   {% if need_swap %}
       {% do adapter.rename_relation(target_relation, backup_relation) %}
@@ -17,8 +17,32 @@
 {# based on spark adapter: https://github.com/dbt-labs/dbt-spark/pull/166/files #}
 {% macro impala__load_csv_rows(model, agate_table) %}
 
+  {# every atomic load, bulk or not, ends with an insert overwrite of the seed table #}
+  {% if model['config'].get('atomic_seed_load', false) %}
+    {% do impala__validate_atomic_seed_load(this) %}
+  {% endif %}
+
+  {% if model['config'].get('load_mode', 'insert') == 'bulk' %}
+    {{ return(impala__load_csv_rows_bulk(model, agate_table)) }}
+  {% endif %}
+
+  {% if (model['config'].get('seed_parallelism', 1) | int) > 1
+        or model['config'].get('max_statement_bytes')
+        or model['config'].get('atomic_seed_load', false) %}
+    {{ return(impala__load_csv_rows_parallel(model, agate_table)) }}
+  {% endif %}
+
   {% set batch_size = get_batch_size() %}
   {% set column_override = model['config'].get('column_types', {}) %}
+  {% set column_types = adapter.get_seed_column_types(agate_table, column_override) %}
+
+  {# the values of one row, the same for every row of the seed #}
+  {% set row_template -%}
+    ({%- for type in column_types -%}
+      cast({{ get_binding_char() }} as {{ type }})
+      {%- if not loop.last %},{%- endif %}
+    {%- endfor -%})
+  {%- endset %}
 
   {% set statements = [] %}
 
@@ -31,15 +55,7 @@
 
       {% set sql %}
           insert into {{ this.render() }} values
-          {% for row in chunk -%}
-              ({%- for col_name in agate_table.column_names -%}
-                  {%- set inferred_type = adapter.convert_type(agate_table, loop.index0) -%}
-                  {%- set type = column_override.get(col_name, inferred_type) -%}
-                    cast({{ get_binding_char() }} as {{type}})
-                  {%- if not loop.last%},{%- endif %}
-              {%- endfor -%})
-              {%- if not loop.last%},{%- endif %}
-          {%- endfor %}
+          {{ ([row_template] * (chunk | length)) | join(',') }}
       {% endset %}
 
       {% do adapter.add_query(sql, bindings=bindings, abridge_sql_log=True) %}
@@ -52,3 +68,221 @@
   {# Return SQL #}
   {{ return(statements[0]) }}
 {% endmacro %}
+
+{# inserts the batches over seed_parallelism connections, into a staging table first when
+   atomic_seed_load is set so that the target, which the materialization leaves untruncated, is
+   replaced by a single insert overwrite.
+   With max_statement_bytes, batches are sized by their rendered statement size instead of
+   get_batch_size() rows #}
+{% macro impala__load_csv_rows_parallel(model, agate_table) %}
+
+  {% set column_override = model['config'].get('column_types', {}) %}
+  {% set column_types = adapter.get_seed_column_types(agate_table, column_override) %}
+  {% set atomic = model['config'].get('atomic_seed_load', false) %}
+
+  {% set target_relation = this %}
+  {% if atomic %}
+    {% set target_relation = this.incorporate(path={"identifier": this.identifier ~ '__dbt_seed_tmp'}) %}
+    {% call statement('drop_seed_staging_table') %}
+      drop table if exists {{ target_relation }}
+    {% endcall %}
+    {% call statement('create_seed_staging_table') %}
+      create table {{ target_relation }} like {{ this }}
+    {% endcall %}
+  {% endif %}
+
+  {% set sql = adapter.insert_seed_rows(
+      target_relation,
+      agate_table,
+      column_types,
+      get_batch_size(),
+      model['config'].get('seed_parallelism', 1) | int,
+      get_binding_char(),
+      model['config'].get('max_statement_bytes')
+  ) %}
+
+  {% if atomic %}
+    {% call statement('load_seed_from_staging_table') %}
+      insert overwrite {{ this }} select * from {{ target_relation }}
+    {% endcall %}
+    {% call statement('drop_seed_staging_table') %}
+      drop table if exists {{ target_relation }}
+    {% endcall %}
+  {% endif %}
+
+  {{ return(sql) }}
+{% endmacro %}
+
+{# writes the seed to a delimited file, reads it through an external text table and loads the
+   target with a single insert ... select, instead of one insert ... values per batch. With
+   atomic_seed_load the statement is an insert overwrite, the target is not truncated first #}
+{% macro impala__load_csv_rows_bulk(model, agate_table) %}
+
+  {% set column_override = model['config'].get('column_types', {}) %}
+  {% set column_types = adapter.get_seed_column_types(agate_table, column_override) %}
+  {% set staging_relation = this.incorporate(path={"identifier": this.identifier ~ '__dbt_seed_stage'}) %}
+
+  {# a failed earlier load may have left its staging table behind #}
+  {% call statement('drop_seed_stage_table') %}
+    drop table if exists {{ staging_relation }}
+  {% endcall %}
+
+  {% set stage = adapter.stage_seed(agate_table, this) %}
+
+  {% call statement('create_seed_stage_table') %}
+    create external table {{ staging_relation }} (
+      {%- for col_name in agate_table.column_names %}
+        c{{ loop.index0 }} string{%- if not loop.last %},{%- endif %}
+      {%- endfor %}
+    )
+    row format delimited fields terminated by ',' escaped by '\\'
+    stored as textfile
+    location '{{ stage.location }}'
+  {% endcall %}
+
+  {% set sql %}
+    insert {{ 'overwrite' if model['config'].get('atomic_seed_load', false) else 'into' }} {{ this.render() }}
+    select
+      {%- for type in column_types %}
+        cast(c{{ loop.index0 }} as {{ type }}){%- if not loop.last %},{%- endif %}
+      {%- endfor %}
+    from {{ staging_relation }}
+  {% endset %}
+
+  {% call statement('load_seed_from_stage') %}
+    {{ sql }}
+  {% endcall %}
+
+  {% call statement('drop_seed_stage_table') %}
+    drop table if exists {{ staging_relation }}
+  {% endcall %}
+  {% do adapter.drop_seed_stage(stage.path) %}
+
+  {{ return(sql) }}
+{% endmacro %}
+
+{# true when the seed table was last loaded from the same rows and column types, per the content
+   hash stored in its table properties #}
+{% macro impala__seed_is_unchanged(relation, content_hash) %}
+  {% set stored_hash = adapter.get_table_property(relation, 'dbt.seed_content_hash') %}
+  {{ return(stored_hash == content_hash) }}
+{% endmacro %}
+
+{# kudu tables can't be the target of an insert overwrite #}
+{% macro impala__seed_is_kudu(relation) %}
+  {% if config.get('stored_as') == 'kudu' %}
+    {{ return(true) }}
+  {% endif %}
+  {% set storage_handler = adapter.get_table_property(relation, 'storage_handler') or '' %}
+  {{ return('kudu' in storage_handler | lower) }}
+{% endmacro %}
+
+{% macro impala__validate_atomic_seed_load(relation) %}
+  {% if impala__seed_is_kudu(relation) %}
+    {{ exceptions.raise_compiler_error("atomic_seed_load is not supported for Kudu seeds, '{}' is a Kudu table".format(relation.render())) }}
+  {% endif %}
+{% endmacro %}
+
+{% macro impala__set_seed_content_hash(relation, content_hash) %}
+  {% call statement('set_seed_content_hash') %}
+    alter table {{ relation }} set tblproperties ('dbt.seed_content_hash'='{{ content_hash }}')
+  {% endcall %}
+{% endmacro %}
+
+{# the default seed materialization, except that a seed table whose stored content hash matches
+   the csv is left as is when skip_unchanged is set, except on --full-refresh, and that with
+   atomic_seed_load an existing seed table is not truncated before the load replaces its rows #}
+{% materialization seed, adapter='impala' %}
+
+  {%- set identifier = model['alias'] -%}
+  {%- set full_refresh_mode = (should_full_refresh()) -%}
+
+  {%- set old_relation = adapter.get_relation(database=database, schema=schema, identifier=identifier) -%}
+
+  {%- set exists_as_table = (old_relation is not none and old_relation.is_table) -%}
+  {%- set exists_as_view = (old_relation is not none and old_relation.is_view) -%}
+
+  {%- set grant_config = config.get('grants') -%}
+  {%- set agate_table = load_agate_table() -%}
+  {%- set column_types = adapter.get_seed_column_types(agate_table, config.get('column_types', {})) -%}
+  {%- set skip_unchanged = config.get('skip_unchanged', false) -%}
+  {#- the rows are only hashed, and the hash only stored, for seeds that can be skipped -#}
+  {%- set content_hash = adapter.get_seed_content_hash(agate_table, column_types) if skip_unchanged else none -%}
+  {%- set atomic_load = config.get('atomic_seed_load', false) -%}
+  -- grab current tables grants config for comparison later on
+
+  {%- do store_result('agate_table', response='OK', agate_table=agate_table) -%}
+
+  {{ run_hooks(pre_hooks, inside_transaction=False) }}
+
+  -- `BEGIN` happens here:
+  {{ run_hooks(pre_hooks, inside_transaction=True) }}
+
+  {% set unchanged = (
+      exists_as_table
+      and not full_refresh_mode
+      and skip_unchanged
+      and impala__seed_is_unchanged(old_relation, content_hash)
+  ) %}
+
+  -- build model
+  {% if unchanged %}
+    {% call noop_statement('main', 'UNCHANGED', 'UNCHANGED', 0) %}
+      -- {{ this }} already holds content {{ content_hash }}
+    {% endcall %}
+  {% else %}
+    {% set create_table_sql = "" %}
+    {% if exists_as_view %}
+      {{ exceptions.raise_compiler_error("Cannot seed to '{}', it is a view".format(old_relation.render())) }}
+    {% elif exists_as_table %}
+      {# an atomic load overwrites the rows of the table once they are all staged, only a full
+         refresh drops it first and an empty seed still truncates it #}
+      {% set atomic_reload = atomic_load and not full_refresh_mode and agate_table.rows | length > 0 %}
+      {# a load that fails half way must not leave the previous hash behind #}
+      {% if skip_unchanged and not full_refresh_mode %}
+        {% do impala__set_seed_content_hash(old_relation, '') %}
+      {% endif %}
+      {% if not atomic_reload %}
+        {% set create_table_sql = reset_csv_table(model, full_refresh_mode, old_relation, agate_table) %}
+      {% endif %}
+    {% else %}
+      {% set create_table_sql = create_csv_table(model, agate_table) %}
+    {% endif %}
+
+    {% set code = 'CREATE' if full_refresh_mode else 'INSERT' %}
+    {% set rows_affected = (agate_table.rows | length) %}
+    {% set sql = "" %}
+    {% if rows_affected > 0 %}
+      {% set sql = load_csv_rows(model, agate_table) %}
+    {% endif %}
+
+    {% if skip_unchanged %}
+      {% do impala__set_seed_content_hash(this, content_hash) %}
+    {% endif %}
+
+    {% call noop_statement('main', code ~ ' ' ~ rows_affected, code, rows_affected) %}
+      {{ get_csv_sql(create_table_sql, sql) }};
+    {% endcall %}
+  {% endif %}
+
+  {% set target_relation = this.incorporate(type='table') %}
+
+  {% set should_revoke = should_revoke(old_relation, full_refresh_mode) %}
+  {% do apply_grants(target_relation, grant_config, should_revoke=should_revoke) %}
+
+  {% do persist_docs(target_relation, model) %}
+
+  {% if full_refresh_mode or not exists_as_table %}
+    {% do create_indexes(target_relation) %}
+  {% endif %}
+
+  {{ run_hooks(post_hooks, inside_transaction=True) }}
+
+  -- `COMMIT` happens here
+  {{ adapter.commit() }}
+
+  {{ run_hooks(post_hooks, inside_transaction=False) }}
+
+  {{ return({'relations': [target_relation]}) }}
+
+{% endmaterialization %}
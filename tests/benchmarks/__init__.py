@@ -0,0 +1 @@
+# Benchmark directory, run with: python -m pytest tests/benchmarks
@@ -0,0 +1,93 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from dbt_common.context import set_invocation_context  # noqa: E402
+
+from dbt.adapters.impala import ImpalaAdapter  # noqa: E402
+from dbt.adapters.impala.column import ImpalaColumn  # noqa: E402
+from dbt.adapters.impala.relation import ImpalaRelation  # noqa: E402
+
+# round trip of a describe extended against a nearby coordinator
+DESCRIBE_LATENCY = 0.005
+
+
+def stub_adapter(relations: int, threads: int) -> ImpalaAdapter:
+    """An adapter whose metadata calls sleep like a cursor waiting on Impala would."""
+    adapter = ImpalaAdapter.__new__(ImpalaAdapter)
+    adapter.config = SimpleNamespace(
+        threads=threads,
+        args=SimpleNamespace(single_threaded=False),
+        credentials=SimpleNamespace(catalog_threads=threads, catalog_column_stats=False),
+        quoting={},
+    )
+    adapter.connection_named = contextmanager(lambda name, query_header_context=None: iter([None]))
+
+    relation_list = [
+        ImpalaRelation.create(schema="bench", identifier=f"t{idx}", type="table")
+        for idx in range(relations)
+    ]
+    adapter.list_relations = lambda database, schema: relation_list
+
+    def get_columns(relation, from_information):
+        time.sleep(DESCRIBE_LATENCY)
+        return [
+            ImpalaColumn(
+                column=f"c{idx}",
+                dtype="string",
+                table_schema=relation.schema,
+                table_name=relation.identifier,
+                table_type="table",
+                column_index=idx,
+            )
+            for idx in range(5)
+        ]
+
+    adapter._get_columns = get_columns
+    return adapter
+
+
+def relation_configs(relations: int):
+    return [
+        SimpleNamespace(
+            database=None,
+            schema="bench",
+            identifier=f"t{idx}",
+            quoting_dict={},
+            catalog_name=None,
+        )
+        for idx in range(relations)
+    ]
+
+
+@pytest.mark.parametrize("threads", [1, 8])
+@pytest.mark.parametrize("relations", [50, 200])
+def test_get_catalog(benchmark, relations, threads):
+    set_invocation_context({})
+    adapter = stub_adapter(relations, threads)
+    configs = relation_configs(relations)
+
+    table, exceptions = benchmark.pedantic(
+        adapter.get_catalog, args=(configs, frozenset({(None, "bench")})), rounds=3, iterations=1
+    )
+
+    assert exceptions == []
+    assert len(table.rows) == relations * 5
@@ -0,0 +1,58 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from dbt_common.clients.agate_helper import table_from_data_flat  # noqa: E402
+
+from dbt.adapters.impala import ImpalaAdapter  # noqa: E402
+from dbt.adapters.impala.relation import ImpalaRelation  # noqa: E402
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "unit", "data")
+RELATION = ImpalaRelation.create(schema="sales", identifier="orders", type="table")
+
+
+def recorded_rows(recording: str, columns: int = 0):
+    """Rows of a recorded describe extended, widened to the given number of data columns."""
+    with open(os.path.join(DATA_DIR, f"describe_extended_{recording}.json")) as recorded:
+        data = json.load(recorded)
+    rows = data["rows"]
+    if columns:
+        header, rest = rows[:2], rows[2:]
+        wide = [[f"col_{idx}", "decimal(18,4)", f"column {idx}"] for idx in range(columns)]
+        rows = header + wide + rest
+    dict_rows = [dict(zip(data["column_names"], row)) for row in rows]
+    return table_from_data_flat(dict_rows, data["column_names"]).rows
+
+
+CASES = {
+    "hive_partitioned_table": recorded_rows("hive_partitioned_table"),
+    "iceberg_table": recorded_rows("iceberg_table"),
+    "hive_partitioned_table_1500_columns": recorded_rows("hive_partitioned_table", 1500),
+    "iceberg_table_1500_columns": recorded_rows("iceberg_table", 1500),
+}
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_parse_describe_extended(benchmark, case):
+    adapter = ImpalaAdapter.__new__(ImpalaAdapter)
+
+    columns = benchmark(adapter.parse_describe_extended, RELATION, CASES[case])
+
+    assert columns
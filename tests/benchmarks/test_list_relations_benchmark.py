@@ -0,0 +1,42 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import agate  # noqa: E402
+
+from dbt.adapters.impala import ImpalaAdapter  # noqa: E402
+from dbt.adapters.impala.relation import ImpalaRelation  # noqa: E402
+
+SCHEMA = ImpalaRelation.create(schema="bench")
+
+
+def listing(relations: int):
+    """Synthetic show tables / show views output, one view for every fourth relation."""
+    names = [f"relation_{idx}" for idx in range(relations)]
+    tables = agate.Table([[name] for name in names], ["name"], [agate.Text()])
+    views = agate.Table([[name] for name in names[::4]], ["name"], [agate.Text()])
+    return tables, views
+
+
+@pytest.mark.parametrize("relations", [100, 1000, 6000])
+def test_relations_from_listing(benchmark, relations):
+    tables, views = listing(relations)
+
+    result = benchmark(ImpalaAdapter._relations_from_listing, SCHEMA, tables, views)
+
+    assert len(result) == relations
+    assert sum(1 for relation in result if relation.is_view) == len(views)
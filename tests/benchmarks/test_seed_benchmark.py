@@ -0,0 +1,81 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import agate  # noqa: E402
+
+from dbt.adapters.impala import ImpalaAdapter  # noqa: E402
+from dbt.adapters.impala import seed_loader  # noqa: E402
+
+BATCH_SIZE = 1000
+
+
+def seed_table(rows: int) -> agate.Table:
+    return agate.Table(
+        [[idx, idx * 1.5, f"name_{idx}"] for idx in range(rows)],
+        ["id", "amount", "name"],
+        [agate.Number(), agate.Number(), agate.Text()],
+    )
+
+
+def render_batches(adapter, agate_table):
+    """What insert_seed_rows renders: column types once, then a row template per batch."""
+    column_types = adapter.get_seed_column_types(agate_table, {})
+    template = seed_loader.row_template(column_types)
+    batches = seed_loader.plan_batches(agate_table.rows, BATCH_SIZE, len(template), 0)
+    return [",".join([template] * (end - start)) for start, end in batches]
+
+
+def render_batches_per_cell(adapter, agate_table):
+    """What impala__load_csv_rows rendered before, inferring the type of every cell."""
+    rows = agate_table.rows
+    batches = []
+    for start in range(0, len(rows), BATCH_SIZE):
+        batches.append(
+            ",".join(
+                "("
+                + ",".join(
+                    f"cast(%s as {adapter.convert_type(agate_table, idx)})"
+                    for idx in range(len(agate_table.column_names))
+                )
+                + ")"
+                for _ in rows[start : start + BATCH_SIZE]
+            )
+        )
+    return batches
+
+
+@pytest.mark.parametrize("rows", [1000, 10000, 100000])
+def test_render_seed_batches(benchmark, rows):
+    adapter = ImpalaAdapter.__new__(ImpalaAdapter)
+    agate_table = seed_table(rows)
+
+    batches = benchmark(render_batches, adapter, agate_table)
+
+    assert len(batches) == -(-rows // BATCH_SIZE)
+
+
+@pytest.mark.parametrize("rows", [250, 500, 1000])
+def test_render_seed_batches_per_cell(benchmark, rows):
+    adapter = ImpalaAdapter.__new__(ImpalaAdapter)
+    agate_table = seed_table(rows)
+
+    batches = benchmark.pedantic(
+        render_batches_per_cell, args=(adapter, agate_table), rounds=3, iterations=1
+    )
+
+    assert batches == render_batches(adapter, agate_table)
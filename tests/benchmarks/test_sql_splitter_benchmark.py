@@ -0,0 +1,63 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from dbt.adapters.impala.sql_splitter import _split, split_statements  # noqa: E402
+
+
+def compiled_model(ctes: int) -> str:
+    """Render a compiled, contract enforced model resembling impala__create_table_as output."""
+    body = []
+    for idx in range(ctes):
+        body.append(
+            f"""
+    cte_{idx} as (
+        -- join step {idx}; keeps the latest row per key
+        select
+            s.id,
+            s.amount * {idx} as amount_{idx},
+            concat(s.name, ';', '{idx}') as label_{idx},  /* literal; with separator */
+            `s`.`weird;column`
+        from source_{idx} s
+        where s.note != 'don''t; split'
+    )"""
+        )
+    select = ",".join(body)
+    return f"""/* {{"app": "dbt", "node_id": "model.bench.model_{ctes}"}} */
+    create table bench.model_{ctes} (id int, amount decimal(18, 2), label string)
+    stored as parquet
+    ;
+    insert into bench.model_{ctes}
+    with {select}
+    select * from cte_{ctes - 1}
+"""
+
+
+CORPUS = [compiled_model(ctes) for ctes in (10, 100, 1000)]
+
+
+@pytest.mark.parametrize("sql", CORPUS, ids=[f"{len(sql) // 1024}KiB" for sql in CORPUS])
+def test_split_uncached(benchmark, sql):
+    statements = benchmark(_split.__wrapped__, sql)
+    assert len(statements) == 2
+
+
+@pytest.mark.parametrize("sql", CORPUS, ids=[f"{len(sql) // 1024}KiB" for sql in CORPUS])
+def test_split_cached(benchmark, sql):
+    split_statements(sql)
+    statements = benchmark(split_statements, sql)
+    assert len(statements) == 2
@@ -0,0 +1,83 @@
+# Copyright 2026 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from dbt.tests.util import rm_file, run_dbt, write_file
+
+_seed_csv = """id,name
+1,one
+2,two
+"""
+
+_changed_seed_csv = """id,name
+1,one
+2,two
+3,three
+"""
+
+# the staging table is created like the seed table, so its int id can't take the string casts
+_string_id_yml = """
+version: 2
+seeds:
+  - name: atomic_seed
+    config:
+      column_types:
+        id: string
+"""
+
+
+class TestAtomicSeedLoadImpala:
+    @pytest.fixture(scope="class")
+    def project_config_update(self):
+        return {"seeds": {"+atomic_seed_load": True}}
+
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {"atomic_seed.csv": _seed_csv}
+
+    def test_failed_load_keeps_rows(self, project):
+        run_dbt(["seed"])
+
+        write_file(_changed_seed_csv, project.project_root, "seeds", "atomic_seed.csv")
+        write_file(_string_id_yml, project.project_root, "seeds", "schema.yml")
+        run_dbt(["seed"], expect_pass=False)
+
+        result = project.run_sql(
+            f"select id, name from {project.test_schema}.atomic_seed order by id", fetch="all"
+        )
+        assert [tuple(row) for row in result] == [(1, "one"), (2, "two")]
+
+    def test_load_replaces_rows(self, project):
+        rm_file(project.project_root, "seeds", "schema.yml")
+        run_dbt(["seed"])
+
+        result = project.run_sql(
+            f"select count(*) from {project.test_schema}.atomic_seed", fetch="one"
+        )
+        assert result[0] == 3
+
+
+class TestAtomicSeedLoadKuduImpala:
+    @pytest.fixture(scope="class")
+    def project_config_update(self):
+        return {"seeds": {"+atomic_seed_load": True, "+stored_as": "kudu"}}
+
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {"atomic_seed.csv": _seed_csv}
+
+    def test_kudu_seed_is_rejected(self, project):
+        for args in (["seed"], ["seed", "--full-refresh"]):
+            result = run_dbt(args, expect_pass=False)
+            assert "atomic_seed_load is not supported for Kudu seeds" in result[0].message
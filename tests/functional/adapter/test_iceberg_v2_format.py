@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import pytest
+from dbt.tests.util import read_file, relation_from_name, run_dbt
 
 from .test_iceberg_format import (
     TestSimpleMaterializationsIcebergFormatImpala,
@@ -185,3 +186,103 @@ class TestInsertoverwriteTransformIcebergV2FormatImpala(TestIncrementalIcebergFo
             "incremental_test_model.sql": insertoverwrite_transform_iceberg_sql,
             "schema.yml": schema_base_yml,
         }
+
+
+merge_iceberg_sql = """
+{{
+    config(
+        materialized="incremental",
+        incremental_strategy="merge",
+        unique_key="id",
+        incremental_predicates=["DBT_INTERNAL_DEST.id > 0"],
+        table_type="iceberg",
+        tbl_properties="('format-version'='2')"
+    )
+}}
+{% if is_incremental() %}
+    select 1 as id, 'updated' as name union all select 3 as id, 'three' as name
+{% else %}
+    select 1 as id, 'one' as name union all select 2 as id, 'two' as name
+{% endif %}
+""".strip()
+
+merge_exclude_iceberg_sql = """
+{{
+    config(
+        materialized="incremental",
+        incremental_strategy="merge",
+        unique_key="ID",
+        merge_exclude_columns=["Note"],
+        table_type="iceberg",
+        tbl_properties="('format-version'='2')"
+    )
+}}
+select 1 as id, 'one' as name, 'first' as note
+""".strip()
+
+merge_not_iceberg_sql = """
+{{
+    config(
+        materialized="incremental",
+        incremental_strategy="merge",
+        unique_key="id"
+    )
+}}
+select 1 as id
+""".strip()
+
+
+class TestMergeIcebergV2FormatImpala:
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"merge_model.sql": merge_iceberg_sql}
+
+    def test_merge(self, project):
+        run_dbt(["run"])
+        run_dbt(["run"])
+
+        run_sql = read_file(
+            project.project_root, "target", "run", "test", "models", "merge_model.sql"
+        )
+        run_sql = " ".join(run_sql.split())
+        assert "merge into" in run_sql
+        assert (
+            "on DBT_INTERNAL_DEST.id > 0 and DBT_INTERNAL_SOURCE.id = DBT_INTERNAL_DEST.id"
+            in run_sql
+        )
+        assert "when matched then update set `name` = DBT_INTERNAL_SOURCE.`name`" in run_sql
+        assert (
+            "when not matched then insert (`id`, `name`) "
+            "values (DBT_INTERNAL_SOURCE.`id`, DBT_INTERNAL_SOURCE.`name`)"
+        ) in run_sql
+
+        relation = relation_from_name(project.adapter, "merge_model")
+        result = project.run_sql(f"select id, name from {relation} order by id", fetch="all")
+        assert [tuple(row) for row in result] == [(1, "updated"), (2, "two"), (3, "three")]
+
+
+class TestMergeExcludeColumnsIcebergV2FormatImpala:
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"merge_model.sql": merge_exclude_iceberg_sql}
+
+    def test_key_and_excluded_columns_are_not_updated(self, project):
+        run_dbt(["run"])
+        run_dbt(["run"])
+
+        run_sql = read_file(
+            project.project_root, "target", "run", "test", "models", "merge_model.sql"
+        )
+        run_sql = " ".join(run_sql.split())
+        assert "when matched then update set `name` = DBT_INTERNAL_SOURCE.`name` when" in run_sql
+        assert "when not matched then insert (`id`, `name`, `note`)" in run_sql
+
+
+class TestMergeRequiresIcebergImpala:
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"merge_model.sql": merge_not_iceberg_sql}
+
+    def test_merge_rejected(self, project):
+        results = run_dbt(["run"], expect_pass=False)
+        assert "only supported for Iceberg v2 tables" in results[0].message
@@ -47,6 +47,37 @@ incremental_kudu_sql = (
 )
 
 
+incremental_upsert_kudu_sql = """
+{{
+    config(
+        materialized="incremental",
+        incremental_strategy="upsert",
+        stored_as="kudu",
+        primary_key="(id)"
+    )
+}}
+{% if is_incremental() %}
+    select 1 as id, 'updated' as name union all select 3 as id, 'three' as name
+{% else %}
+    select 1 as id, 'one' as name union all select 2 as id, 'two' as name
+{% endif %}
+""".strip()
+
+
+class TestIncrementalUpsertKudu:
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"incremental_upsert_model.sql": incremental_upsert_kudu_sql}
+
+    def test_incremental_upsert(self, project):
+        run_dbt(["run"])
+        run_dbt(["run"])
+
+        relation = relation_from_name(project.adapter, "incremental_upsert_model")
+        result = project.run_sql(f"select id, name from {relation} order by id", fetch="all")
+        assert [tuple(row) for row in result] == [(1, "updated"), (2, "two"), (3, "three")]
+
+
 class TestIncrementalKudu(BaseIncremental):
     @pytest.fixture(scope="class")
     def project_config_update(self):
@@ -0,0 +1,73 @@
+# Copyright 2026 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from dbt.tests.util import get_connection, relation_from_name, run_dbt, write_file
+
+_seed_csv = """id,name
+1,one
+2,two
+"""
+
+_changed_seed_csv = """id,name
+1,one
+2,two
+3,three
+"""
+
+
+class TestSeedContentHashImpala:
+    @pytest.fixture(scope="class")
+    def project_config_update(self):
+        return {"seeds": {"+skip_unchanged": True}}
+
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {"hashed_seed.csv": _seed_csv}
+
+    def test_unchanged_seed_is_skipped(self, project):
+        first_run = run_dbt(["seed"])
+        assert first_run[0].adapter_response["_message"] == "INSERT 2"
+
+        second_run = run_dbt(["seed"])
+        assert second_run[0].adapter_response["_message"] == "UNCHANGED"
+
+        full_refresh = run_dbt(["seed", "--full-refresh"])
+        assert full_refresh[0].adapter_response["_message"] == "CREATE 2"
+
+        write_file(_changed_seed_csv, project.project_root, "seeds", "hashed_seed.csv")
+        changed_run = run_dbt(["seed"])
+        assert changed_run[0].adapter_response["_message"] == "INSERT 3"
+
+        result = project.run_sql(
+            f"select count(*) from {project.test_schema}.hashed_seed", fetch="one"
+        )
+        assert result[0] == 3
+
+
+class TestSeedReloadedByDefaultImpala:
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {"reloaded_seed.csv": _seed_csv}
+
+    def test_unchanged_seed_is_reloaded(self, project):
+        run_dbt(["seed"])
+
+        second_run = run_dbt(["seed"])
+        assert second_run[0].adapter_response["_message"] == "INSERT 2"
+
+        relation = relation_from_name(project.adapter, "reloaded_seed")
+        with get_connection(project.adapter):
+            stored_hash = project.adapter.get_table_property(relation, "dbt.seed_content_hash")
+        assert stored_hash is None
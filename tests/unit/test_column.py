@@ -0,0 +1,71 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dbt.adapters.impala.column import ImpalaCatalogColumn, ImpalaColumn
+
+
+def describe_columns():
+    table_stats = ImpalaColumn.convert_table_stats("2048 bytes, 10 rows")
+    return [
+        ImpalaColumn(
+            table_schema="sales",
+            table_name="orders",
+            table_type="table",
+            table_owner="etl",
+            table_stats=table_stats,
+            table_comment="orders fact table",
+            column=name,
+            dtype=dtype,
+            column_index=idx,
+            comment=comment,
+        )
+        for idx, (name, dtype, comment) in enumerate(
+            [("id", "int", "order id"), ("amount", "decimal(10,2)", None)]
+        )
+    ]
+
+
+class TestImpalaCatalogColumn:
+    def test_columns_share_table_metadata(self):
+        catalog_columns = ImpalaCatalogColumn.from_columns(describe_columns())
+
+        assert catalog_columns[0].table is catalog_columns[1].table
+        assert not hasattr(catalog_columns[0], "__dict__")
+
+    def test_to_column_dict(self):
+        catalog_columns = ImpalaCatalogColumn.from_columns(describe_columns())
+
+        assert catalog_columns[1].to_column_dict() == {
+            "table_database": None,
+            "table_schema": "sales",
+            "table_name": "orders",
+            "table_type": "table",
+            "table_owner": "etl",
+            "table_comment": "orders fact table",
+            "column_index": 1,
+            "column_name": "amount",
+            "column_type": "decimal(10,2)",
+            "column_comment": None,
+            "stats:bytes:label": "bytes",
+            "stats:bytes:value": 2048,
+            "stats:bytes:description": "",
+            "stats:bytes:include": True,
+            "stats:rows:label": "rows",
+            "stats:rows:value": 10,
+            "stats:rows:description": "",
+            "stats:rows:include": True,
+        }
+
+    def test_no_columns(self):
+        assert ImpalaCatalogColumn.from_columns([]) == []
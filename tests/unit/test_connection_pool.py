@@ -0,0 +1,89 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dbt.adapters.impala.connection_pool import ImpalaConnectionPool
+
+
+class FakeHandle:
+    def __init__(self, healthy=True):
+        self.healthy = healthy
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def wrap(pooled):
+    if not pooled.handle.healthy:
+        raise OSError("connection reset")
+    return pooled
+
+
+class TestConnectionPool:
+    def test_reuses_released_handle(self):
+        pool = ImpalaConnectionPool(max_size=2, idle_timeout=300, max_lifetime=3600)
+        opened = []
+
+        def connect():
+            opened.append(FakeHandle())
+            return opened[-1]
+
+        first = pool.checkout(connect, wrap)
+        pool.release(first)
+        second = pool.checkout(connect, wrap)
+
+        assert len(opened) == 1
+        assert second.handle is first.handle
+
+    def test_bounded_size(self):
+        pool = ImpalaConnectionPool(max_size=1, idle_timeout=300, max_lifetime=3600)
+        first = pool.checkout(FakeHandle, wrap)
+        second = pool.checkout(FakeHandle, wrap)
+
+        pool.release(first)
+        pool.release(second)
+
+        assert pool.size() == 1
+        assert second.handle.closed
+
+    def test_discards_unhealthy_and_non_reusable_handles(self):
+        pool = ImpalaConnectionPool(max_size=2, idle_timeout=300, max_lifetime=3600)
+        broken = pool.checkout(FakeHandle, wrap)
+        cancelled = pool.checkout(FakeHandle, wrap)
+
+        pool.release(broken)
+        pool.release(cancelled, reusable=False)
+        broken.handle.healthy = False
+
+        fresh = pool.checkout(FakeHandle, wrap)
+
+        assert cancelled.handle.closed
+        assert broken.handle.closed
+        assert fresh.handle is not broken.handle
+        assert pool.size() == 0
+
+    def test_idle_eviction_and_max_lifetime(self):
+        pool = ImpalaConnectionPool(max_size=2, idle_timeout=10, max_lifetime=100)
+        idle = pool.checkout(FakeHandle, wrap)
+        old = pool.checkout(FakeHandle, wrap)
+        pool.release(idle)
+        idle.last_used_at -= 11
+
+        old.created_at -= 101
+        pool.release(old)
+
+        assert old.handle.closed
+        fresh = pool.checkout(FakeHandle, wrap)
+        assert idle.handle.closed
+        assert fresh.handle is not idle.handle
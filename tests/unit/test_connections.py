@@ -0,0 +1,261 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+from dbt.adapters.contracts.connection import ConnectionState
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.impala.connections import (
+    DEFAULT_ASYNC_MAX_POLL_INTERVAL,
+    DEFAULT_ASYNC_POLL_INTERVAL,
+    ImpalaConnectionManager,
+    ImpalaConnectionWrapper,
+)
+
+
+class FakeCursor:
+    description = [("id", "INT"), ("name", "STRING")]
+
+    def __init__(self, row_count):
+        self.rows = [(idx, f"name_{idx}") for idx in range(row_count)]
+        self.fetch_sizes = []
+
+    def fetchmany(self, size):
+        self.fetch_sizes.append(size)
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    def fetchall(self):
+        raise AssertionError("results should be streamed with fetchmany")
+
+
+class FakeAsyncCursor:
+    has_result_set = False
+    close_finished_queries = True
+
+    def __init__(self, polls_until_done):
+        self.polls_until_done = polls_until_done
+        self.polls = 0
+        self.cancelled = False
+        self.closed_operation = False
+
+    def execute_async(self, sql, bindings, configuration):
+        self.sql = sql
+
+    def is_executing(self):
+        self.polls += 1
+        return not self.cancelled and self.polls < self.polls_until_done
+
+    def cancel_operation(self):
+        self.cancelled = True
+
+    def _wait_to_finish(self):
+        pass
+
+    def _close_finished_operation(self):
+        self.closed_operation = True
+
+
+class FakeHandle:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+
+class FakePooledHandle:
+    def __init__(self):
+        self.closed = False
+
+    def cursor(self):
+        return SimpleNamespace(close=lambda: None)
+
+    def close(self):
+        self.closed = True
+
+
+class TestResultStreaming:
+    def test_result_table_is_built_from_batches(self):
+        cursor = FakeCursor(250)
+        wrapper = ImpalaConnectionWrapper(FakeHandle(cursor), fetch_batch_size=100)
+
+        table = ImpalaConnectionManager.get_result_from_cursor(wrapper, None)
+
+        assert len(table.rows) == 250
+        assert table.column_names == ("id", "name")
+        assert cursor.fetch_sizes == [100, 100, 100, 100]
+
+    def test_limit_bounds_rows_fetched(self):
+        cursor = FakeCursor(250)
+        wrapper = ImpalaConnectionWrapper(FakeHandle(cursor), fetch_batch_size=100)
+
+        rows = list(wrapper.iter_rows(limit=120))
+
+        assert len(rows) == 120
+        assert cursor.fetch_sizes == [100, 20]
+
+    def test_zero_limit_fetches_every_row(self):
+        cursor = FakeCursor(250)
+        wrapper = ImpalaConnectionWrapper(FakeHandle(cursor), fetch_batch_size=100)
+
+        assert len(list(wrapper.iter_rows(limit=0))) == 250
+
+    def test_batch_size_is_the_cursor_arraysize(self):
+        cursor = FakeCursor(0)
+        ImpalaConnectionWrapper(FakeHandle(cursor), fetch_batch_size=100)
+
+        assert cursor.arraysize == 100
+
+
+class TestAsyncExecution:
+    def test_polls_until_finished(self):
+        cursor = FakeAsyncCursor(polls_until_done=4)
+        wrapper = ImpalaConnectionWrapper(FakeHandle(cursor))
+
+        wrapper.execute_async("insert into t select 1", poll_interval=0.001)
+
+        assert cursor.polls == 4
+        assert cursor.closed_operation
+        assert not cursor.cancelled
+
+    def test_poll_interval_is_capped(self):
+        cursor = FakeAsyncCursor(polls_until_done=12)
+        wrapper = ImpalaConnectionWrapper(FakeHandle(cursor))
+        waits = []
+        wrapper._cancel_requested = SimpleNamespace(
+            clear=lambda: None, wait=lambda timeout: waits.append(timeout)
+        )
+
+        wrapper.execute_async("insert into t select 1")
+
+        assert waits[0] == DEFAULT_ASYNC_POLL_INTERVAL
+        assert max(waits) == DEFAULT_ASYNC_MAX_POLL_INTERVAL == 1.0
+
+    def test_cancel_from_another_thread_cancels_on_server(self):
+        cursor = FakeAsyncCursor(polls_until_done=10**9)
+        wrapper = ImpalaConnectionWrapper(FakeHandle(cursor))
+        errors = []
+
+        def run():
+            try:
+                wrapper.execute_async("select sleep(100000)", poll_interval=0.001)
+            except DbtRuntimeError as exc:
+                errors.append(exc)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        while cursor.polls == 0:
+            pass
+
+        assert wrapper.request_cancel(timeout=5)
+        thread.join()
+
+        assert cursor.cancelled
+        assert len(errors) == 1
+
+    def test_cancel_without_running_query(self):
+        wrapper = ImpalaConnectionWrapper(FakeHandle(FakeAsyncCursor(polls_until_done=1)))
+
+        assert not wrapper.request_cancel(timeout=0.1)
+
+
+class TestImpalaVersion:
+    def teardown_method(self):
+        ImpalaConnectionManager.impala_version = None
+
+    def test_version_tuple(self):
+        ImpalaConnectionManager.impala_version = "impalad version 4.5.0-"
+        assert ImpalaConnectionManager.impala_version_tuple() == (4, 5, 0)
+
+        ImpalaConnectionManager.impala_version = "impalad version 4.0.0.2024.0.18.0-61"
+        assert ImpalaConnectionManager.impala_version_tuple() == (4, 0, 0)
+
+        ImpalaConnectionManager.impala_version = "impalad version 3.4"
+        assert ImpalaConnectionManager.impala_version_tuple() == (3, 4, 0)
+
+    def test_unknown_version(self):
+        ImpalaConnectionManager.impala_version = "NA"
+        assert ImpalaConnectionManager.impala_version_tuple() is None
+
+
+class TestPrewarmConnections:
+    @staticmethod
+    def credentials(pool_size):
+        return SimpleNamespace(
+            use_connection_pool=True,
+            connection_pool_size=pool_size,
+            connection_pool_idle_timeout=300,
+            connection_pool_max_lifetime=3600,
+            fetch_batch_size=1024,
+            _pool_key=lambda: ("prewarm", pool_size),
+        )
+
+    @pytest.fixture(autouse=True)
+    def fake_connect(self, monkeypatch):
+        opened = []
+
+        def _connect(cls, credentials):
+            if len(opened) in self.failing:
+                opened.append(None)
+                raise OSError("connection refused")
+            opened.append(FakePooledHandle())
+            return opened[-1]
+
+        self.failing = set()
+        monkeypatch.setattr(ImpalaConnectionManager, "_connect", classmethod(_connect))
+        monkeypatch.setattr(ImpalaConnectionManager, "impala_version", "4.5.0")
+        monkeypatch.setattr(ImpalaConnectionManager, "_connection_pools", {})
+        monkeypatch.setattr(ImpalaConnectionManager, "_prewarm_requests", {})
+        return opened
+
+    def test_count_is_capped_by_pool_size(self, fake_connect):
+        credentials = self.credentials(pool_size=3)
+
+        timings = ImpalaConnectionManager.prewarm_connections(credentials, 8)
+
+        assert len(timings) == 3
+        assert len(fake_connect) == 3
+        assert ImpalaConnectionManager._get_connection_pool(credentials).size() == 3
+
+    def test_failed_connections_are_skipped(self, fake_connect):
+        credentials = self.credentials(pool_size=4)
+        self.failing = {1, 2}
+
+        timings = ImpalaConnectionManager.prewarm_connections(credentials, 4)
+
+        assert len(timings) == 2
+        assert ImpalaConnectionManager._get_connection_pool(credentials).size() == 2
+
+    def test_prewarm_happens_on_first_open(self, fake_connect):
+        credentials = self.credentials(pool_size=4)
+        manager = SimpleNamespace(
+            profile=SimpleNamespace(credentials=credentials),
+            _connection_pools_lock=ImpalaConnectionManager._connection_pools_lock,
+            _prewarm_requests=ImpalaConnectionManager._prewarm_requests,
+        )
+
+        ImpalaConnectionManager.request_prewarm(manager, 3)
+        assert fake_connect == []
+
+        for _ in range(2):
+            connection = SimpleNamespace(state=ConnectionState.INIT, credentials=credentials)
+            ImpalaConnectionManager.open(connection)
+
+        # the first open pre-warmed 3 connections and checked one out, the second reused one
+        assert len(fake_connect) == 3
+        assert ImpalaConnectionManager._get_connection_pool(credentials).size() == 1
@@ -0,0 +1,135 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+
+import agate
+import pytest
+from dbt_common.clients.agate_helper import table_from_data_flat
+
+from dbt.adapters.impala import ImpalaAdapter
+from dbt.adapters.impala.column import ImpalaColumn
+from dbt.adapters.impala.relation import ImpalaRelation
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+RECORDINGS = sorted(
+    name[len("describe_extended_") : -len(".json")]
+    for name in os.listdir(DATA_DIR)
+    if name.startswith("describe_extended_")
+)
+
+
+def load_describe_extended(recording: str) -> agate.Table:
+    with open(os.path.join(DATA_DIR, f"describe_extended_{recording}.json")) as recorded:
+        data = json.load(recorded)
+    # the same conversion a cursor result goes through, empty names stay empty strings
+    rows = [dict(zip(data["column_names"], row)) for row in data["rows"]]
+    return table_from_data_flat(rows, data["column_names"])
+
+
+def reference_parse(relation, raw_rows):
+    """The two pass parser parse_describe_extended used to be, kept to check equivalence."""
+    dict_rows = [dict(zip(row._keys, row._values)) for row in raw_rows]
+    partition_separator_pos = ImpalaAdapter.find_partition_information_separator(dict_rows)
+    table_separator_pos = ImpalaAdapter.find_table_information_separator(dict_rows)
+    column_separator_pos = (
+        partition_separator_pos if partition_separator_pos > 0 else table_separator_pos
+    )
+    rows = [
+        row
+        for row in raw_rows[0:column_separator_pos]
+        if not row["name"].startswith("#") and not row["name"] == ""
+    ]
+    metadata = {}
+    for col in raw_rows[table_separator_pos + 1 :]:
+        col_dict = dict(zip(col._keys, col._values))
+        name = (col_dict.get("name") or "").strip()
+        if name.startswith("#"):
+            continue
+        type_val = (col_dict.get("type") or "").strip()
+        comment_val = (col_dict.get("comment") or "").strip()
+        if name:
+            key = name.split(":")[0].strip()
+            if not key:
+                continue
+            value = type_val or comment_val
+        else:
+            key = type_val
+            value = comment_val
+        if not key or not value or value.upper() == "NULL":
+            continue
+        metadata[key] = value
+
+    return [
+        ImpalaColumn(
+            table_database=None,
+            table_schema=relation.schema,
+            table_name=relation.name,
+            table_type=relation.type,
+            table_owner=str(metadata.get("Owner")),
+            table_stats=ImpalaColumn.convert_table_stats(metadata.get("Statistics")),
+            column=column["name"],
+            column_index=idx,
+            dtype=column["type"],
+            comment=column.get("comment"),
+            table_comment=metadata.get("comment"),
+        )
+        for idx, column in enumerate(rows)
+    ]
+
+
+RELATION = ImpalaRelation.create(schema="sales", identifier="orders", type="table")
+
+
+class TestParseDescribeExtended:
+    @pytest.mark.parametrize("recording", RECORDINGS)
+    def test_matches_reference_parser(self, recording):
+        rows = load_describe_extended(recording).rows
+        adapter = ImpalaAdapter.__new__(ImpalaAdapter)
+
+        assert adapter.parse_describe_extended(RELATION, rows) == reference_parse(RELATION, rows)
+
+    def test_hive_partitioned_table(self):
+        rows = load_describe_extended("hive_partitioned_table").rows
+        adapter = ImpalaAdapter.__new__(ImpalaAdapter)
+
+        columns = adapter.parse_describe_extended(RELATION, rows)
+
+        assert [(c.column, c.dtype, c.comment) for c in columns] == [
+            ("id", "int", "order id"),
+            ("amount", "decimal(10,2)", None),
+            ("note", "string", "free text"),
+            ("dt", "string", None),
+        ]
+        assert columns[0].table_owner == "etl"
+        assert columns[0].table_comment == "orders fact table"
+
+    def test_iceberg_partition_transforms_are_not_columns(self):
+        rows = load_describe_extended("iceberg_table").rows
+        adapter = ImpalaAdapter.__new__(ImpalaAdapter)
+
+        columns = adapter.parse_describe_extended(RELATION, rows)
+
+        assert [c.column for c in columns] == ["id", "event_ts", "payload"]
+        assert columns[0].table_owner == "None"
+        assert columns[0].table_comment is None
+
+    def test_get_table_property(self):
+        table = load_describe_extended("hive_partitioned_table")
+        adapter = ImpalaAdapter.__new__(ImpalaAdapter)
+        adapter.execute_macro = lambda name, kwargs: table
+
+        assert adapter.get_table_property(RELATION, "numRows") == "1000"
+        assert adapter.get_table_property(RELATION, "dbt.seed_content_hash") is None
@@ -0,0 +1,589 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import agate
+import pytest
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from dbt.adapters.cache import RelationsCache
+from dbt_common.context import set_invocation_context
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.impala import ImpalaAdapter
+from dbt.adapters.impala.column import ImpalaColumn
+from dbt.adapters.impala.metadata_cache import ImpalaMetadataCache
+from dbt.adapters.impala.relation import ImpalaRelation
+
+
+def make_adapter(cache_population_threads=None, threads=1):
+    """An adapter without a live connection, enough to exercise the python side."""
+    adapter = ImpalaAdapter.__new__(ImpalaAdapter)
+    adapter.config = SimpleNamespace(
+        threads=threads,
+        args=SimpleNamespace(single_threaded=False),
+        credentials=SimpleNamespace(
+            cache_population_threads=cache_population_threads,
+            bulk_column_metadata=True,
+            catalog_threads=None,
+            catalog_column_stats=False,
+        ),
+    )
+    adapter.cache = RelationsCache()
+    adapter._cache_population_lock = threading.Lock()
+    adapter._relation_index = {}
+    adapter._metadata_cache = None
+    adapter._schema_fingerprints = {}
+    adapter.connection_named = contextmanager(lambda name, query_header_context=None: iter([None]))
+    return adapter
+
+
+class TestCachePopulation:
+    def test_schemas_are_listed_concurrently(self):
+        set_invocation_context({})
+        adapter = make_adapter(cache_population_threads=4)
+        schemas = {ImpalaRelation.create(schema=f"schema_{idx}") for idx in range(4)}
+        # every listing waits for the others, so this only finishes with 4 workers
+        barrier = threading.Barrier(len(schemas), timeout=5)
+
+        def list_relations(schema_relation):
+            barrier.wait()
+            return [
+                ImpalaRelation.create(schema=schema_relation.schema, identifier=f"t{idx}")
+                for idx in range(3)
+            ]
+
+        adapter.list_relations_without_caching = list_relations
+
+        adapter._relations_cache_for_schemas([], schemas)
+
+        for schema in schemas:
+            assert len(adapter.cache.get_relations(None, schema.schema)) == 3
+            assert (None, schema.schema) in adapter.cache
+
+
+class TestRelationIndex:
+    def test_lookup_is_case_insensitive_and_follows_the_cache(self):
+        adapter = make_adapter()
+        table = ImpalaRelation.create(schema="Sales", identifier="Orders", type="table")
+        adapter.cache_added(table)
+
+        assert (
+            adapter._get_cached_relation(
+                ImpalaRelation.create(schema="sales", identifier="orders")
+            )
+            is table
+        )
+
+        renamed = ImpalaRelation.create(schema="sales", identifier="orders_v2", type="table")
+        adapter.cache_renamed(table, renamed)
+        assert adapter._get_cached_relation(table) is None
+        assert adapter._get_cached_relation(renamed).identifier == "orders_v2"
+
+        adapter.cache_dropped(renamed)
+        assert adapter._get_cached_relation(renamed) is None
+
+    def test_relation_dropped_behind_the_adapter_is_not_returned(self):
+        adapter = make_adapter()
+        view = ImpalaRelation.create(schema="sales", identifier="orders_view", type="view")
+        adapter.cache_added(view)
+
+        adapter.cache.drop(view)
+
+        assert adapter._get_cached_relation(view) is None
+
+    def test_altered_columns_are_described_again(self):
+        adapter = make_adapter()
+        table = ImpalaRelation.create(
+            schema="sales",
+            identifier="orders",
+            type="table",
+            information=" |-- id: int (nullable = true)\n",
+        )
+        adapter.cache_added(table)
+        assert [c.column for c in adapter.parse_columns_from_information(table)] == ["id"]
+
+        adapter.cache_columns_changed(table)
+
+        assert adapter._get_cached_relation(table) is None
+
+
+class TestBulkColumnMetadata:
+    def test_information_is_parsed_into_columns(self):
+        adapter = make_adapter()
+        result = agate.Table(
+            [
+                ["Orders", "id", "INT", "NO"],
+                ["Orders", "amount", "DECIMAL(18,2)", "YES"],
+                ["customers", "name", "STRING", "YES"],
+            ],
+            ["table_name", "column_name", "data_type", "is_nullable"],
+            [agate.Text()] * 4,
+        )
+        adapter.execute_macro = lambda name, kwargs: result
+        schema = ImpalaRelation.create(schema="sales")
+
+        information = adapter._information_from_information_schema(schema)
+
+        orders = ImpalaRelation.create(
+            schema="sales", identifier="orders", information=information["orders"]
+        )
+        columns = adapter.parse_columns_from_information(orders)
+        assert [(c.column, c.dtype) for c in columns] == [
+            ("id", "int"),
+            ("amount", "decimal(18,2)"),
+        ]
+        assert set(information) == {"orders", "customers"}
+
+    def test_catalog_describes_relations_with_information(self):
+        adapter = make_adapter()
+        orders = ImpalaRelation.create(
+            schema="sales",
+            identifier="orders",
+            type="table",
+            information=" |-- id: int (nullable = true)\n",
+        )
+        adapter.cache_added(orders)
+        adapter.execute_macro = lambda name, kwargs: agate.Table(
+            [["id", "int", "order id"]], ["name", "type", "comment"]
+        )
+
+        assert adapter.get_columns_in_relation(orders)[0].comment is None
+        catalog_columns = adapter._get_columns_for_catalog(orders)
+        assert catalog_columns[0].to_column_dict()["column_comment"] == "order id"
+
+
+class TestPersistedMetadata:
+    ORDERS = ImpalaRelation.create(schema="sales", identifier="orders", type="table")
+    DESCRIBE = agate.Table([["id", "int", "order id"]], ["name", "type", "comment"])
+
+    @pytest.fixture
+    def adapter(self, tmp_path):
+        adapter = make_adapter()
+        adapter._metadata_cache = ImpalaMetadataCache(str(tmp_path / "cache.sqlite"), ttl=60)
+        adapter._use_information_schema_listing = lambda: True
+        adapter.macro_calls = []
+        adapter.information_schema_columns = [["orders", "id", "INT", "YES"]]
+
+        def execute_macro(name, kwargs):
+            adapter.macro_calls.append(name)
+            if name == "impala__list_columns_from_information_schema":
+                return agate.Table(
+                    adapter.information_schema_columns,
+                    ["table_name", "column_name", "data_type", "is_nullable"],
+                    [agate.Text()] * 4,
+                )
+            if name == "impala__list_relations_from_information_schema":
+                return agate.Table([["orders", "TABLE"]], ["name", "table_type"])
+            return self.DESCRIBE
+
+        adapter.execute_macro = execute_macro
+        yield adapter
+        adapter._metadata_cache.close()
+
+    def next_invocation(self, adapter):
+        adapter._schema_fingerprints = {}
+        adapter.cache = RelationsCache()
+        adapter._relation_index = {}
+        adapter.macro_calls.clear()
+
+    def populate_cache(self, adapter):
+        set_invocation_context({})
+        adapter._relations_cache_for_schemas([], {ImpalaRelation.create(schema="sales")})
+
+    def test_validated_columns_are_reused(self, adapter):
+        assert adapter.get_columns_in_relation(self.ORDERS)[0].comment == "order id"
+        self.next_invocation(adapter)
+
+        assert adapter.get_columns_in_relation(self.ORDERS)[0].comment == "order id"
+        assert adapter.macro_calls == ["impala__list_columns_from_information_schema"]
+
+    def test_columns_altered_outside_dbt_are_described_again(self, adapter):
+        adapter.get_columns_in_relation(self.ORDERS)
+        self.next_invocation(adapter)
+        adapter.information_schema_columns = [["orders", "id", "BIGINT", "YES"]]
+
+        adapter.get_columns_in_relation(self.ORDERS)
+
+        assert adapter.macro_calls[-1] == "get_columns_in_relation"
+
+    def test_reused_listing_has_current_columns(self, adapter):
+        self.populate_cache(adapter)
+        self.next_invocation(adapter)
+        adapter.information_schema_columns = [
+            ["orders", "id", "BIGINT", "YES"],
+            ["orders", "note", "STRING", "YES"],
+        ]
+
+        self.populate_cache(adapter)
+
+        columns = adapter.get_columns_in_relation(self.ORDERS)
+        assert [(c.column, c.dtype) for c in columns] == [("id", "bigint"), ("note", "string")]
+        assert adapter.macro_calls == ["impala__list_columns_from_information_schema"]
+
+    def test_columns_altered_by_dbt_are_current_in_the_next_run(self, adapter):
+        self.populate_cache(adapter)
+        adapter.get_columns_in_relation(self.ORDERS)
+        adapter.information_schema_columns = [["orders", "id", "BIGINT", "YES"]]
+        adapter.cache_columns_changed(self.ORDERS)
+        self.next_invocation(adapter)
+
+        self.populate_cache(adapter)
+
+        columns = adapter.get_columns_in_relation(self.ORDERS)
+        assert [(c.column, c.dtype) for c in columns] == [("id", "bigint")]
+
+    def test_nothing_is_reused_without_information_schema(self, adapter):
+        adapter._use_information_schema_listing = lambda: False
+        adapter._metadata_cache.put_relations("sales", [{"identifier": "orders", "type": "table"}])
+
+        adapter.list_relations_without_caching(ImpalaRelation.create(schema="sales"))
+        adapter.get_columns_in_relation(self.ORDERS)
+
+        assert "impala__list_tables_without_caching" in adapter.macro_calls
+        assert adapter._metadata_cache.get_columns("sales", "orders") is None
+
+    def test_intermediate_relations_are_not_persisted(self, adapter):
+        tmp = ImpalaRelation.create(schema="sales", identifier="orders__dbt_tmp", type="table")
+
+        adapter.get_columns_in_relation(tmp)
+
+        assert adapter._metadata_cache.get_columns("sales", "orders__dbt_tmp") is None
+
+    def test_relations_changed_by_dbt_keep_the_listing(self, adapter):
+        adapter._metadata_cache.put_relations("sales", [{"identifier": "orders", "type": "table"}])
+
+        adapter.cache_added(
+            ImpalaRelation.create(schema="sales", identifier="customers", type="table")
+        )
+        adapter.cache_dropped(self.ORDERS)
+
+        listing = adapter._metadata_cache.get_relations("sales")
+        assert [relation["identifier"] for relation in listing] == ["customers"]
+
+
+class TestCatalog:
+    def test_only_requested_relations_are_described(self):
+        set_invocation_context({})
+        adapter = make_adapter()
+        listing = {
+            "sales": [
+                ImpalaRelation.create(schema="sales", identifier=name, type="table")
+                for name in ("orders", "customers", "not_dbt")
+            ],
+            "finance": [
+                ImpalaRelation.create(schema="finance", identifier="ledger", type="table")
+            ],
+        }
+        described = []
+
+        def get_columns(relation, from_information):
+            described.append(relation.identifier)
+            return [
+                ImpalaColumn(
+                    column="id",
+                    dtype="int",
+                    table_schema=relation.schema,
+                    table_name=relation.identifier,
+                    table_type="table",
+                )
+            ]
+
+        adapter.list_relations = lambda database, schema: listing[schema]
+        adapter._get_columns = get_columns
+
+        catalog = adapter._get_one_catalog_by_relations(
+            None,
+            [
+                ImpalaRelation.create(schema="sales", identifier="Orders"),
+                ImpalaRelation.create(schema="Sales", identifier="customers"),
+                ImpalaRelation.create(schema="finance", identifier="ledger"),
+            ],
+            frozenset({(None, "sales"), (None, "finance")}),
+        )
+
+        assert sorted(described) == ["customers", "ledger", "orders"]
+        assert sorted(catalog.columns["table_name"]) == ["customers", "ledger", "orders"]
+
+    def test_catalog_is_filtered_on_used_schemas(self):
+        set_invocation_context({})
+        adapter = make_adapter()
+        adapter.list_relations = lambda database, schema: [
+            ImpalaRelation.create(schema=schema, identifier="orders", type="table")
+        ]
+        adapter._get_columns = lambda relation, from_information: [
+            ImpalaColumn(
+                column="id",
+                dtype="int",
+                table_schema=relation.schema,
+                table_name=relation.identifier,
+            )
+        ]
+
+        catalog = adapter._get_one_catalog_by_relations(
+            None,
+            [
+                ImpalaRelation.create(schema="sales", identifier="orders"),
+                ImpalaRelation.create(schema="staging", identifier="orders"),
+            ],
+            frozenset({(None, "Sales")}),
+        )
+
+        assert list(catalog.columns["table_schema"]) == ["sales"]
+
+    def test_catalog_of_relation_configs_iterator(self):
+        set_invocation_context({})
+        adapter = make_adapter()
+        adapter.config.quoting = {}
+        adapter.list_relations = lambda database, schema: [
+            ImpalaRelation.create(schema="sales", identifier=name, type="table")
+            for name in ("orders", "not_dbt")
+        ]
+        adapter._get_columns = lambda relation, from_information: [
+            ImpalaColumn(
+                column="id",
+                dtype="int",
+                table_schema=relation.schema,
+                table_name=relation.identifier,
+            )
+        ]
+        relation_configs = iter(
+            [
+                SimpleNamespace(
+                    database=None,
+                    schema="Sales",
+                    identifier="orders",
+                    quoting_dict={},
+                    catalog_name=None,
+                )
+            ]
+        )
+
+        catalog, exceptions = adapter.get_catalog(relation_configs, frozenset({(None, "sales")}))
+
+        assert exceptions == []
+        assert list(catalog.columns["table_name"]) == ["orders"]
+
+    def test_relations_are_described_in_one_chunk_per_worker(self):
+        set_invocation_context({})
+        adapter = make_adapter()
+        adapter.config.credentials.catalog_threads = 2
+        relations = [
+            ImpalaRelation.create(schema="sales", identifier=f"t{idx}", type="table")
+            for idx in range(6)
+        ]
+        opened = []
+
+        @contextmanager
+        def connection_named(name, query_header_context=None):
+            opened.append(name)
+            yield
+
+        adapter.connection_named = connection_named
+        adapter.list_relations = lambda database, schema: relations
+        adapter._get_columns = lambda relation, from_information: [
+            ImpalaColumn(column="id", dtype="int", table_schema="sales", table_name="t")
+        ]
+
+        catalog = adapter._get_catalog_of_relations(adapter._list_catalog_relations("sales"))
+
+        assert len(catalog.rows) == 6
+        assert sorted(opened) == ["catalog_0", "catalog_1"]
+
+    def test_column_stats_are_added_to_table_stats(self):
+        set_invocation_context({})
+        adapter = make_adapter()
+        adapter.config.credentials.catalog_column_stats = True
+        orders = ImpalaRelation.create(schema="sales", identifier="orders", type="table")
+        adapter.list_relations = lambda database, schema: [orders]
+        adapter._get_columns = lambda relation, from_information: [
+            ImpalaColumn(
+                column="id",
+                dtype="int",
+                table_schema="sales",
+                table_name="orders",
+                table_type="table",
+            )
+        ]
+        # Column, Type, #Distinct Values, #Nulls, Max Size, Avg Size
+        stats = agate.Table(
+            [["id", "INT", 1000, 0, 4, 4.0], ["note", "STRING", -1, -1, -1, -1.0]],
+            ["Column", "Type", "#Distinct Values", "#Nulls", "Max Size", "Avg Size"],
+        )
+        opened = []
+
+        @contextmanager
+        def connection_named(name, query_header_context=None):
+            opened.append(name)
+            yield
+
+        adapter.connection_named = connection_named
+        adapter.execute_macro = lambda name, kwargs: stats
+
+        catalog = adapter._get_catalog_of_relations(adapter._list_catalog_relations("sales"))
+
+        # the stats are fetched on the connection that described the table
+        assert opened == ["catalog_0"]
+
+        row = catalog.rows[0]
+        assert row["stats:column_stats:value"] == 1
+        assert row["stats:column_stats:description"] == (
+            "id: 1000 distinct values, 0 nulls, 4 max size, 4.0 avg size"
+        )
+        assert [name for name in catalog.column_names if name.startswith("stats:")] == [
+            "stats:column_stats:label",
+            "stats:column_stats:value",
+            "stats:column_stats:description",
+            "stats:column_stats:include",
+        ]
+
+
+class TestSeedColumnTypes:
+    def test_inferred_once_with_overrides(self):
+        adapter = make_adapter()
+        table = agate.Table(
+            [[1, 1.5, "a"], [2, 2.0, "b"]],
+            ["id", "amount", "name"],
+            [agate.Number(), agate.Number(), agate.Text()],
+        )
+
+        column_types = adapter.get_seed_column_types(table, {"name": "varchar(10)"})
+
+        assert column_types == ["integer", "real", "varchar(10)"]
+
+
+class RecordingConnections:
+    """Stands in for the connection manager, recording the statements of every thread."""
+
+    def __init__(self, fail_on=None):
+        self.statements = []
+        self.fail_on = fail_on
+        self._lock = threading.Lock()
+
+    def add_query(self, sql, bindings=None, abridge_sql_log=False):
+        if self.fail_on is not None and bindings[0] == self.fail_on:
+            raise RuntimeError("insert failed")
+        with self._lock:
+            self.statements.append((sql, bindings))
+        return None, SimpleNamespace(rows=len(bindings) // 2)
+
+    def get_response(self, cursor):
+        return SimpleNamespace(rows_affected=cursor.rows)
+
+
+class TestParallelSeedLoad:
+    SEED = agate.Table(
+        [[idx, f"name_{idx}"] for idx in range(10)],
+        ["id", "name"],
+        [agate.Number(), agate.Text()],
+    )
+    RELATION = ImpalaRelation.create(schema="sales", identifier="countries")
+
+    def test_batches_are_inserted(self):
+        set_invocation_context({})
+        adapter = make_adapter()
+        adapter.connections = RecordingConnections()
+
+        sql = adapter.insert_seed_rows(self.RELATION, self.SEED, ["integer", "string"], 4, 3)
+
+        assert sql == (
+            "insert into sales.countries values "
+            "(cast(%s as integer),cast(%s as string)),"
+            "(cast(%s as integer),cast(%s as string)),"
+            "(cast(%s as integer),cast(%s as string)),"
+            "(cast(%s as integer),cast(%s as string))"
+        )
+        bindings = sorted(b for _, batch in adapter.connections.statements for b in batch[::2])
+        assert bindings == list(range(10))
+        assert len(adapter.connections.statements) == 3
+
+    def test_batches_share_one_connection_per_worker(self):
+        set_invocation_context({})
+        adapter = make_adapter()
+        adapter.connections = RecordingConnections()
+        opened = []
+
+        @contextmanager
+        def connection_named(name, query_header_context=None):
+            opened.append(name)
+            yield
+
+        adapter.connection_named = connection_named
+
+        adapter.insert_seed_rows(self.RELATION, self.SEED, ["integer", "string"], 2, 2)
+
+        assert len(adapter.connections.statements) == 5
+        assert sorted(opened) == ["seed_countries_0", "seed_countries_1"]
+
+    def test_failed_batches_are_reported(self):
+        set_invocation_context({})
+        adapter = make_adapter()
+        adapter.connections = RecordingConnections(fail_on=4)
+
+        with pytest.raises(DbtRuntimeError, match="1 of 3 seed batches failed"):
+            adapter.insert_seed_rows(self.RELATION, self.SEED, ["integer", "string"], 4, 3)
+
+
+class TestStaticPartitionOverwrite:
+    TARGET = ImpalaRelation.create(schema="sales", identifier="orders")
+    SOURCE = ImpalaRelation.create(schema="sales", identifier="orders__dbt_tmp")
+    COLUMNS = [ImpalaColumn(column="id", dtype="int"), ImpalaColumn(column="dt", dtype="string")]
+
+    def make_adapter(self, partitions, fail_on=None):
+        adapter = make_adapter()
+        statements = []
+
+        def add_query(sql, bindings=None, abridge_sql_log=False):
+            if fail_on is not None and fail_on in sql:
+                raise RuntimeError("insert overwrite failed")
+            statements.append(sql)
+            return None, SimpleNamespace(rows=10)
+
+        adapter.execute = lambda sql, fetch=False: (
+            None,
+            agate.Table([[dt] for dt in partitions], ["dt"], [agate.Text()]),
+        )
+        adapter.connections = SimpleNamespace(
+            add_query=add_query,
+            get_response=lambda cursor: SimpleNamespace(rows_affected=cursor.rows),
+        )
+        return adapter, statements
+
+    @pytest.mark.parametrize("parallelism", [1, 2])
+    def test_only_partitions_of_source_are_overwritten(self, parallelism):
+        set_invocation_context({})
+        adapter, statements = self.make_adapter(["2024-01-08", "2024-01-09"])
+
+        response = adapter.overwrite_partitions(
+            self.TARGET, self.SOURCE, self.COLUMNS, "dt", parallelism
+        )
+
+        assert sorted(statements) == [
+            "insert overwrite sales.orders partition(dt='2024-01-08') "
+            "select id from sales.orders__dbt_tmp where dt = '2024-01-08'",
+            "insert overwrite sales.orders partition(dt='2024-01-09') "
+            "select id from sales.orders__dbt_tmp where dt = '2024-01-09'",
+        ]
+        assert response.partitions_rewritten == 2
+        assert response.rows_affected == 20
+        assert response._message == "OK (2 partitions, 20 rows)"
+
+    def test_failed_partitions_are_reported(self):
+        set_invocation_context({})
+        adapter, _ = self.make_adapter(["2024-01-08", "2024-01-09"], fail_on="2024-01-09")
+
+        with pytest.raises(DbtRuntimeError, match="1 of 2 partitions of sales.orders failed"):
+            adapter.overwrite_partitions(self.TARGET, self.SOURCE, self.COLUMNS, ["dt"], 2)
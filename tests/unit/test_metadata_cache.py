@@ -0,0 +1,115 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sqlite3
+import time
+
+import pytest
+
+from dbt.adapters.impala.column import ImpalaColumn
+from dbt.adapters.impala.metadata_cache import ImpalaMetadataCache, column_fingerprint
+
+RELATIONS = [
+    {"identifier": "orders", "type": "table"},
+    {"identifier": "orders_view", "type": "view"},
+]
+COLUMNS = [
+    ImpalaColumn(column="id", dtype="int", table_schema="sales", table_name="orders").to_dict(
+        omit_none=True
+    )
+]
+FINGERPRINT = column_fingerprint([("id", "int")])
+
+
+@pytest.fixture
+def metadata_cache(tmp_path):
+    cache = ImpalaMetadataCache(str(tmp_path / "target" / "cache.sqlite"), ttl=60)
+    yield cache
+    cache.close()
+
+
+class TestMetadataCache:
+    def test_entries_survive_reopening(self, metadata_cache):
+        metadata_cache.put_relations("Sales", RELATIONS)
+        metadata_cache.put_columns("sales", "Orders", COLUMNS, FINGERPRINT)
+        metadata_cache.close()
+
+        reopened = ImpalaMetadataCache(metadata_cache.path, ttl=60)
+
+        assert reopened.get_relations("sales") == RELATIONS
+        stored, fingerprint = reopened.get_columns("sales", "orders")
+        columns = [ImpalaColumn.from_dict(c) for c in stored]
+        assert [(c.column, c.dtype) for c in columns] == [("id", "int")]
+        assert fingerprint == FINGERPRINT
+        reopened.close()
+
+    def test_entries_expire(self, metadata_cache):
+        metadata_cache.put_relations("sales", RELATIONS)
+        metadata_cache.ttl = 0.01
+        time.sleep(0.02)
+
+        assert metadata_cache.get_relations("sales") is None
+
+    def test_changed_relation_count_drops_columns(self, metadata_cache):
+        metadata_cache.put_relations("sales", RELATIONS)
+        metadata_cache.put_columns("sales", "orders", COLUMNS, FINGERPRINT)
+
+        metadata_cache.put_relations("sales", RELATIONS[:1])
+
+        assert metadata_cache.get_columns("sales", "orders") is None
+
+    def test_evict_relation(self, metadata_cache):
+        metadata_cache.put_relations("sales", RELATIONS)
+        metadata_cache.put_columns("sales", "orders", COLUMNS, FINGERPRINT)
+
+        metadata_cache.evict_relation("sales", "orders")
+
+        assert metadata_cache.get_relations("sales") is None
+        assert metadata_cache.get_columns("sales", "orders") is None
+
+    def test_relations_changed_by_dbt_update_the_listing(self, metadata_cache):
+        metadata_cache.put_relations("sales", RELATIONS)
+        metadata_cache.put_columns("sales", "orders", COLUMNS, FINGERPRINT)
+
+        metadata_cache.put_relation("sales", {"identifier": "Orders", "type": "table"})
+        metadata_cache.put_relation("sales", {"identifier": "customers", "type": "table"})
+        metadata_cache.remove_relation("sales", "orders_view")
+
+        assert sorted(r["identifier"] for r in metadata_cache.get_relations("sales")) == [
+            "Orders",
+            "customers",
+        ]
+        assert metadata_cache.get_columns("sales", "orders") is None
+
+    def test_older_cache_files_are_dropped(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        old = sqlite3.connect(path)
+        old.executescript(
+            """
+            pragma user_version = 1;
+            create table columns (schema_name text, identifier text, payload text, stored_at real);
+            insert into columns values ('sales', 'orders', '[]', 0);
+            """
+        )
+        old.close()
+
+        metadata_cache = ImpalaMetadataCache(path, ttl=60)
+
+        assert metadata_cache.get_columns("sales", "orders") is None
+        metadata_cache.put_columns("sales", "orders", COLUMNS, FINGERPRINT)
+        metadata_cache.close()
+
+    def test_fingerprint_ignores_case(self):
+        assert column_fingerprint([("ID", "INT")]) == FINGERPRINT
+        assert column_fingerprint([("id", "bigint")]) != FINGERPRINT
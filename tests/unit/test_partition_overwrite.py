@@ -0,0 +1,65 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import decimal
+
+import pytest
+
+from dbt.adapters.impala import partition_overwrite
+
+
+class TestPartitionOverwrite:
+    @pytest.mark.parametrize(
+        "partition_by,expected",
+        [
+            ("dt", ["dt"]),
+            ("dt, country", ["dt", "country"]),
+            (["dt", "country"], ["dt", "country"]),
+        ],
+    )
+    def test_partition_columns(self, partition_by, expected):
+        assert partition_overwrite.partition_columns(partition_by) == expected
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (None, "NULL"),
+            (True, "true"),
+            (decimal.Decimal("2024"), "2024"),
+            (decimal.Decimal("1E+2"), "100"),
+            (7, "7"),
+            (datetime.date(2024, 1, 8), "'2024-01-08'"),
+            (datetime.datetime(2024, 1, 8, 10, 12, 31), "'2024-01-08 10:12:31'"),
+            ("0012", "'0012'"),
+            ("it's\\", "'it\\'s\\\\'"),
+        ],
+    )
+    def test_partition_literal(self, value, expected):
+        assert partition_overwrite.partition_literal(value) == expected
+
+    def test_overwrite_statement(self):
+        sql = partition_overwrite.overwrite_statement(
+            "sales.orders",
+            "sales.orders__dbt_tmp",
+            "id, amount",
+            ["dt", "country"],
+            ["2024-01-08", None],
+        )
+
+        assert sql == (
+            "insert overwrite sales.orders partition(dt='2024-01-08', country=NULL) "
+            "select id, amount from sales.orders__dbt_tmp "
+            "where dt = '2024-01-08' and country is null"
+        )
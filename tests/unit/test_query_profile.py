@@ -0,0 +1,79 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dbt.adapters.impala.query_profile import (
+    QueryProfileSummary,
+    parse_duration_ms,
+    parse_query_profile,
+)
+
+PROFILE = """Query (id=5a4f1c2b3d4e5f60:9a8b7c6d00000000):
+  Summary:
+    Session ID: 1234:5678
+    Query Type: DML
+    Per Node Peak Memory Usage: host-1:27000(12.50 MB) host-2:27000(4.00 MB)
+    Query Timeline: 1s204ms
+       - Submit for admission: 3.100ms (3.100ms)
+       - Completed admission: 254.300ms (251.200ms)
+  ImpalaServer:
+     - ClientFetchWaitTimer: 0.000ns
+  Execution Profile 5a4f1c2b3d4e5f60:9a8b7c6d00000000:(Total: 950.112ms, non-child: 0.000ns)
+    Coordinator Fragment F01:(Total: 900.500ms, non-child: 1.000ms)
+      HDFS_TABLE_SINK:
+         - NumModifiedRows: 1.20K (1200)
+    Averaged Fragment F00:(Total: 400.000ms, non-child: 0.000ns)
+      HDFS_SCAN_NODE (id=0):
+         - BytesRead: 1.00 MB (1048576)
+    Fragment F00:
+      Instance 5a4f1c2b3d4e5f60:9a8b7c6d00000001 (host=host-1:27000):(Total: 410.0ms)
+        HDFS_SCAN_NODE (id=0):
+           - BytesRead: 1.00 MB (1048576)
+           - PeakMemoryUsage: 64.00 KB (65536)
+      Instance 5a4f1c2b3d4e5f60:9a8b7c6d00000002 (host=host-2:27000):(Total: 390.0ms)
+        HDFS_SCAN_NODE (id=0):
+           - BytesRead: 512
+"""
+
+
+class TestQueryProfile:
+    def test_parse_duration(self):
+        assert parse_duration_ms("1m2s345ms") == 62345.0
+        assert parse_duration_ms("12.500us") == 0.0125
+
+    def test_parse_profile(self):
+        summary = parse_query_profile(PROFILE)
+
+        assert summary.query_id == "5a4f1c2b3d4e5f60:9a8b7c6d00000000"
+        assert summary.peak_memory_bytes == int(12.5 * (1 << 20))
+        # averaged fragment counters are not added to the instance counters
+        assert summary.bytes_scanned == 1048576 + 512
+        assert summary.rows_produced == 1200
+        assert summary.admission_wait_ms == 251.2
+        assert summary.fragment_times_ms == {"F01": 900.5, "F00": 400.0}
+
+    def test_merge(self):
+        first = QueryProfileSummary(
+            query_id="a", peak_memory_bytes=10, bytes_scanned=5, fragment_times_ms={"F00": 1.0}
+        )
+        second = QueryProfileSummary(
+            query_id="b", peak_memory_bytes=7, rows_produced=3, fragment_times_ms={"F00": 2.0}
+        )
+
+        merged = first.merge(second)
+
+        assert merged.query_id == "b"
+        assert merged.peak_memory_bytes == 10
+        assert merged.bytes_scanned == 5
+        assert merged.rows_produced == 3
+        assert merged.fragment_times_ms == {"F00": 3.0}
@@ -0,0 +1,114 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import decimal
+
+import agate
+
+from dbt.adapters.impala import seed_loader
+
+
+class TestSeedLoader:
+    def test_format_value(self):
+        assert seed_loader.format_value(None) == "\\N"
+        assert seed_loader.format_value(True) == "true"
+        assert seed_loader.format_value(decimal.Decimal("1E+2")) == "100"
+        assert seed_loader.format_value(decimal.Decimal("1.50")) == "1.50"
+        assert seed_loader.format_value(datetime.date(2024, 1, 8)) == "2024-01-08"
+        assert (
+            seed_loader.format_value(datetime.datetime(2024, 1, 8, 10, 12, 31))
+            == "2024-01-08 10:12:31"
+        )
+        assert seed_loader.format_value("a,b\\c\nd") == "a\\,b\\\\c\\\nd"
+
+    def test_write_delimited_file(self, tmp_path):
+        table = agate.Table(
+            [[1, "one", None], [2, "two, too", True]],
+            ["id", "name", "flag"],
+            [agate.Number(), agate.Text(), agate.Boolean()],
+        )
+        path = tmp_path / seed_loader.DATA_FILE_NAME
+
+        rows = seed_loader.write_delimited_file(table, str(path))
+
+        assert rows == 2
+        assert path.read_text() == "1,one,\\N\n2,two\\, too,true\n"
+
+    def test_stage_location(self):
+        name = seed_loader.new_stage_name("sales", "countries")
+
+        assert name.startswith("sales__countries__")
+        assert (
+            seed_loader.stage_location("hdfs:///tmp/seeds/", name) == f"hdfs:///tmp/seeds/{name}"
+        )
+
+    def test_fixed_batches(self):
+        rows = [[idx] for idx in range(10)]
+
+        assert seed_loader.plan_batches(rows, 4, 20, 30) == [(0, 4), (4, 8), (8, 10)]
+
+    def test_batches_sized_by_statement_bytes(self):
+        template = seed_loader.row_template(["integer", "string"])
+        header = "insert into sales.countries values "
+        narrow = [[idx, "x"] for idx in range(100)]
+        wide = [[idx, "x" * 500] for idx in range(100)]
+
+        narrow_batches = seed_loader.plan_batches(narrow, 10, len(template), len(header), 4096)
+        wide_batches = seed_loader.plan_batches(wide, 10, len(template), len(header), 4096)
+
+        # row count no longer caps the batch, the statement size does
+        assert narrow_batches[0][1] > 10
+        assert len(wide_batches) > len(narrow_batches)
+        for batches, rows in ((narrow_batches, narrow), (wide_batches, wide)):
+            assert batches[0][0] == 0 and batches[-1][1] == len(rows)
+            assert all(
+                end == next_start for (_, end), (next_start, _) in zip(batches, batches[1:])
+            )
+            for start, end in batches:
+                rendered = len(header) + sum(
+                    len(template)
+                    + 1
+                    + sum(seed_loader.estimate_binding_bytes(v) - 2 for v in rows[idx])
+                    for idx in range(start, end)
+                )
+                assert rendered <= 4096
+
+    def test_oversized_row_gets_its_own_batch(self):
+        rows = [["x" * 100], ["y" * 10000], ["z"]]
+
+        assert seed_loader.plan_batches(rows, 10, 20, 30, 1000) == [(0, 1), (1, 2), (2, 3)]
+
+    def test_content_hash(self):
+        def table(rows, names=("id", "name")):
+            return agate.Table(rows, list(names), [agate.Number(), agate.Text()])
+
+        content_hash = seed_loader.content_hash(table([[1, "a,b"], [2, None]]), ["int", "string"])
+
+        assert content_hash == seed_loader.content_hash(
+            table([[1, "a,b"], [2, None]]), ["int", "string"]
+        )
+        assert content_hash != seed_loader.content_hash(
+            table([[1, "a,b"], [2, None]]), ["bigint", "string"]
+        )
+        assert content_hash != seed_loader.content_hash(
+            table([[1, "a,b"], [2, None]], ("id", "label")), ["int", "string"]
+        )
+        # the same characters split differently into values
+        assert content_hash != seed_loader.content_hash(
+            table([[1, "a"], [None, "b"]]), ["int", "string"]
+        )
+        assert content_hash != seed_loader.content_hash(
+            table([[1, "a,b"], [2, "\\N"]]), ["int", "string"]
+        )
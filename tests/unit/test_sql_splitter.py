@@ -0,0 +1,60 @@
+# Copyright 2024 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from dbt.adapters.impala.sql_splitter import split_statements
+
+
+class TestSplitStatements:
+    @pytest.mark.parametrize(
+        "sql,expected",
+        [
+            ("select 1", ("select 1",)),
+            ("select 1;", ("select 1",)),
+            ("select 1; select 2", ("select 1", "select 2")),
+            ("select ';' as a; select 2", ("select ';' as a", "select 2")),
+            ("select \"a;b\", 'it\\'s;'", ("select \"a;b\", 'it\\'s;'",)),
+            ("select `weird;col` from t", ("select `weird;col` from t",)),
+            (
+                "select 1 -- trailing; comment\n; select 2",
+                ("select 1 -- trailing; comment", "select 2"),
+            ),
+            ("select /* a;b */ 1; select 2", ("select /* a;b */ 1", "select 2")),
+            ("select 1; -- only a comment", ("select 1",)),
+            ("select 1; /* only; a comment */ ;", ("select 1",)),
+            ("", ()),
+            ("  ;  ; ", ()),
+        ],
+    )
+    def test_split(self, sql, expected):
+        assert split_statements(sql) == expected
+
+    def test_contract_enforced_create_table_as(self):
+        sql = """
+            /* {"app": "dbt", "node_id": "model.test.my_model"} */
+            create table my_schema.my_model (id int, note string)
+            ;
+            insert into my_schema.my_model
+            select 1 as id, 'a; b' as note
+        """
+
+        create, insert = split_statements(sql)
+
+        assert create.startswith("/* {")
+        assert create.endswith("(id int, note string)")
+        assert insert.endswith("'a; b' as note")
+
+    def test_unterminated_literal_is_not_split(self):
+        assert split_statements("select 'abc; select 2") == ("select 'abc; select 2",)